@@ -0,0 +1 @@
+"""Shared tooling for running and measuring the days/NN puzzle solutions"""
@@ -0,0 +1,211 @@
+"""Run one day's solver over many puzzle inputs, one JSON line per input
+
+    python -m advent_2022.batch days/11/part2.py inputs/11/ -j 8
+    python -m advent_2022.batch days/24/day_24.py 'inputs/*/24.txt'
+
+INPUTS are files, directories (every file inside) or glob patterns. Each
+worker process imports the solver once when it starts and then takes inputs
+until they run out, so imports and warm-up are paid once per worker rather
+than once per input. Lines are printed as inputs finish, not in input order.
+A worker that dies (segfault, OOM kill, a solver that fails to import)
+takes the pool with it, and every input it hadn't finished is recorded as
+crashed.
+"""
+import argparse
+import ast
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+from advent_2022.solvers import SOLVE_ARGS, Solver
+
+# the solve function loaded into each worker by warm_up()
+_solve = None
+
+
+def expand_inputs(patterns):
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            yield from sorted(p for p in path.iterdir() if p.is_file())
+        elif path.exists():
+            yield path
+        else:
+            yield from (Path(p) for p in sorted(glob.glob(pattern)))
+
+
+def solvers_for(script, function, args=None):
+    """One Solver per argument set; by default the ones bench uses"""
+    solver = Solver(Path(script).resolve(), function)
+    if args is not None:
+        return [solver._replace(args=args)]
+    return [solver._replace(args=a) for a in SOLVE_ARGS.get(solver.key, [()])]
+
+
+def jsonable(result):
+    # numpy scalars are common answers and json can't encode them
+    if hasattr(result, "item"):
+        return result.item()
+    if isinstance(result, (int, float, str, bool)) or result is None:
+        return result
+    return repr(result)
+
+
+def warm_up(script, function):
+    global _solve
+    _solve = Solver(Path(script), function).load()
+
+
+def solve_one(input_path, args):
+    record = {"input": str(input_path), "args": repr(args), "worker": os.getpid()}
+    try:
+        input_data = Path(input_path).read_text()
+        start = time.perf_counter()
+        result = _solve(input_data, *args)
+        record["wall"] = time.perf_counter() - start
+    except Exception as err:
+        record["status"] = "error"
+        record["error"] = f"{type(err).__name__}: {err}"
+        return record
+    record["status"] = "ok"
+    record["result"] = jsonable(result)
+    return record
+
+
+def crashed(solver, input_path):
+    return {
+        "solver": solver.name,
+        "input": str(input_path),
+        "args": repr(solver.args),
+        "status": "crashed",
+    }
+
+
+def run_batch(solvers, inputs, jobs=None):
+    """Yield one record per (solver, input) as each finishes"""
+    by_function = {}
+    for solver in solvers:
+        by_function.setdefault((solver.path, solver.function), []).append(solver)
+
+    for (script, function), group in by_function.items():
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=warm_up, initargs=(script, function)
+        ) as pool:
+            tasks = [(solver, path) for solver in group for path in inputs]
+            futures = {}
+            try:
+                for solver, path in tasks:
+                    futures[pool.submit(solve_one, path, solver.args)] = solver, path
+            except BrokenProcessPool:
+                # the pool broke while inputs were still being handed out
+                for solver, path in tasks[len(futures) :]:
+                    yield crashed(solver, path)
+
+            for future in as_completed(futures):
+                solver, path = futures[future]
+                try:
+                    yield {"solver": solver.name, **future.result()}
+                except BrokenProcessPool:
+                    yield crashed(solver, path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("script", type=Path, help="e.g. days/01/part1.py")
+    parser.add_argument("inputs", nargs="+", help="files, directories or globs")
+    parser.add_argument("-f", "--function", default="solve")
+    parser.add_argument(
+        "-a",
+        "--args",
+        type=ast.literal_eval,
+        help="extra solve() arguments as a Python tuple, e.g. '(10_000,)'",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=0, help="worker processes, 0 for all cores"
+    )
+    args = parser.parse_args(argv)
+
+    inputs = list(expand_inputs(args.inputs))
+    if not inputs:
+        parser.error("no input files found")
+
+    solvers = solvers_for(args.script, args.function, args.args)
+    for record in run_batch(solvers, inputs, args.jobs or os.cpu_count()):
+        sys.stdout.write(json.dumps(record) + "\n")
+        sys.stdout.flush()
+
+
+# --> Test driven development helpers
+
+
+def test_expand_inputs(tmp_path):
+    for name in ("a.txt", "b.txt", "c.log"):
+        (tmp_path / name).write_text("")
+    assert [p.name for p in expand_inputs([str(tmp_path)])] == [
+        "a.txt",
+        "b.txt",
+        "c.log",
+    ]
+    assert [p.name for p in expand_inputs([str(tmp_path / "*.txt")])] == [
+        "a.txt",
+        "b.txt",
+    ]
+
+
+def test_solvers_for_uses_bench_arguments():
+    from advent_2022.solvers import DAYS
+
+    solvers = solvers_for(DAYS / "24" / "day_24.py", "solve")
+    assert [s.args for s in solvers] == [(1,), (2,)]
+
+
+def test_run_batch_reuses_workers(tmp_path):
+    from advent_2022.solvers import DAYS
+
+    inputs = []
+    for n in range(6):
+        path = tmp_path / f"{n}.txt"
+        path.write_text(f"{n}\n\n{n + 1}\n")
+        inputs.append(path)
+
+    solvers = solvers_for(DAYS / "01" / "part1.py", "solve")
+    records = list(run_batch(solvers, inputs, jobs=2))
+    assert sorted(r["result"] for r in records) == [1, 2, 3, 4, 5, 6]
+    assert len({r["worker"] for r in records}) <= 2
+
+
+def crashing_day(tmp_path, source):
+    script = tmp_path / "92" / "part1.py"
+    script.parent.mkdir()
+    script.write_text(source)
+    inputs = []
+    for n in range(3):
+        path = tmp_path / f"{n}.txt"
+        path.write_text(str(n))
+        inputs.append(path)
+    return solvers_for(script, "solve"), inputs
+
+
+def test_run_batch_records_crashes(tmp_path):
+    source = "import os\n\n\ndef solve(input_data):\n    os._exit(1)\n"
+    solvers, inputs = crashing_day(tmp_path, source)
+    records = list(run_batch(solvers, inputs, jobs=2))
+    assert sorted(r["input"] for r in records) == sorted(map(str, inputs))
+    assert {r["status"] for r in records} == {"crashed"}
+
+
+def test_run_batch_records_failed_warm_up(tmp_path):
+    source = "raise ImportError('no such helper')\n"
+    solvers, inputs = crashing_day(tmp_path, source)
+    records = list(run_batch(solvers, inputs, jobs=2))
+    assert len(records) == len(inputs)
+    assert {r["status"] for r in records} == {"crashed"}
+
+
+if __name__ == "__main__":
+    main()
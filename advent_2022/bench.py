@@ -0,0 +1,374 @@
+"""Time every solve() under days/ and write the results as JSON
+
+    python -m advent_2022.bench -n 5 -o bench.json
+    python -m advent_2022.bench -j 0 --timeout 600
+
+Each solver runs `repeat` times on its own days/NN/input.txt. Wall time,
+CPU time and peak RSS are recorded per part, together with a hash of the
+input so runs from different commits can be compared like for like.
+
+With --jobs or --timeout every part runs in a worker process of its own,
+longest first according to the previous report. A part that raises, kills
+its worker or overruns is recorded as such without stopping the others;
+an overrunning worker is killed from the parent.
+"""
+import argparse
+import hashlib
+import json
+import multiprocessing
+import multiprocessing.connection
+import os
+import platform
+import resource
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from advent_2022.debug import ic
+from advent_2022.solvers import DAYS, ROOT, Solver, discover
+
+CLEAR_REFS = Path("/proc/self/clear_refs")
+PROC_STATUS = Path("/proc/self/status")
+# extra seconds a worker gets to report its own timeout before it's killed
+KILL_GRACE = 1.0
+
+
+# --> Measurement
+
+
+def reset_peak_rss():
+    """Reset the kernel's high-water mark so the next reading is per part.
+
+    Only Linux supports this; elsewhere the peak is for the whole process.
+    """
+    try:
+        CLEAR_REFS.write_text("5")
+    except OSError:
+        pass
+
+
+def peak_rss_kb():
+    try:
+        for line in PROC_STATUS.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports kilobytes
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+class PartTimeout(BaseException):
+    """Raised from SIGALRM; a BaseException so solver code can't swallow it"""
+
+
+def _raise_timeout(signum, frame):
+    raise PartTimeout
+
+
+def new_record(solver, repeat):
+    return {
+        "solver": solver.name,
+        "day": solver.day,
+        "module": solver.path.stem,
+        "function": solver.function,
+        "args": repr(solver.args),
+        "repeat": repeat,
+    }
+
+
+def measure(solver, repeat=1, timeout=None, input_path=None):
+    """Run one solver `repeat` times and return its timings as a dict.
+
+    timeout is in seconds for all repeats together, and is checked between
+    bytecodes, so a single long numpy call or blocking syscall can overrun
+    it; run_parallel() enforces it from outside. input_path replaces the
+    day's own input.txt.
+    """
+    record = new_record(solver, repeat)
+    input_path = Path(input_path or solver.input_path)
+    if not input_path.exists():
+        record["status"] = "no input"
+        return record
+
+    input_data = input_path.read_text()
+    record["input_sha256"] = hashlib.sha256(input_data.encode()).hexdigest()
+
+    if timeout:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        solve = solver.load()
+        # same as the scripts' __main__: no debug trace on the real input
+        ic.disable()
+        wall, cpu = [], []
+        reset_peak_rss()
+        for _ in range(repeat):
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            result = solve(input_data, *solver.args)
+            wall.append(time.perf_counter() - wall_start)
+            cpu.append(time.process_time() - cpu_start)
+    except PartTimeout:
+        record["status"] = "timeout"
+        return record
+    except Exception as err:
+        record["status"] = "error"
+        record["error"] = f"{type(err).__name__}: {err}"
+        return record
+    finally:
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    record["status"] = "ok"
+    record["result"] = repr(result)
+    record["wall"] = wall
+    record["cpu"] = cpu
+    record["peak_rss_kb"] = peak_rss_kb()
+    return record
+
+
+def git_commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def environment():
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+# --> Scheduling
+
+
+def previous_mean_walls(report_path):
+    """Mean wall time of one repeat, per solver name, from an earlier
+    report if any"""
+    try:
+        report = json.loads(Path(report_path).read_text())
+    except (OSError, ValueError):
+        return {}
+    return {
+        record["solver"]: sum(record["wall"]) / record["repeat"]
+        for record in report.get("results", [])
+        if record.get("status") == "ok"
+    }
+
+
+def longest_first(solvers, mean_walls):
+    """Known-slow parts first so they don't finish last on idle workers.
+
+    Parts without a previous timing might be slow too, so they go first.
+    """
+    return sorted(
+        solvers, key=lambda s: mean_walls.get(s.name, float("inf")), reverse=True
+    )
+
+
+def measure_into(conn, solver, repeat, timeout):
+    """Worker process body: send measure()'s record back to the parent"""
+    conn.send(measure(solver, repeat, timeout))
+    conn.close()
+
+
+def start_worker(solver, repeat, timeout):
+    receive, send = multiprocessing.Pipe(duplex=False)
+    worker = multiprocessing.Process(
+        target=measure_into, args=(send, solver, repeat, timeout), daemon=True
+    )
+    worker.start()
+    # the parent's copy closed, the pipe reads EOF when the worker dies
+    send.close()
+    deadline = time.monotonic() + timeout + KILL_GRACE if timeout else None
+    return receive, (solver, worker, deadline)
+
+
+def run_parallel(solvers, repeat, jobs, timeout=None):
+    """Yield records in completion order, running each part in a worker
+    process of its own, at most `jobs` at a time.
+
+    The deadline is kept here in the parent: the SIGALRM inside measure()
+    can't interrupt a long C call, so a worker still running KILL_GRACE
+    seconds after its timeout is killed and recorded as a timeout. A worker
+    that dies without a record (segfault, OOM kill) is recorded as crashed,
+    and only its own part goes with it.
+    """
+    todo = list(reversed(solvers))
+    running = {}
+    try:
+        while todo or running:
+            while todo and len(running) < jobs:
+                conn, job = start_worker(todo.pop(), repeat, timeout)
+                running[conn] = job
+
+            deadlines = [deadline for _, _, deadline in running.values()]
+            wait = None
+            if None not in deadlines:
+                wait = max(0.0, min(deadlines) - time.monotonic())
+            ready = multiprocessing.connection.wait(list(running), wait)
+
+            now = time.monotonic()
+            for conn, (solver, worker, deadline) in list(running.items()):
+                if conn in ready:
+                    try:
+                        record = conn.recv()
+                    except EOFError:
+                        record = {**new_record(solver, repeat), "status": "crashed"}
+                elif deadline is not None and now >= deadline:
+                    worker.kill()
+                    record = {**new_record(solver, repeat), "status": "timeout"}
+                else:
+                    continue
+                del running[conn]
+                conn.close()
+                worker.join()
+                yield record
+    finally:
+        for conn, (_, worker, _) in running.items():
+            worker.kill()
+            conn.close()
+
+
+# --> Reporting
+
+
+def summary_line(record):
+    if record["status"] != "ok":
+        return f"{record['solver']:<32} {record['status']}"
+    return (
+        f"{record['solver']:<32} "
+        f"wall {min(record['wall']):9.4f}s  "
+        f"cpu {min(record['cpu']):9.4f}s  "
+        f"rss {record['peak_rss_kb'] / 1024:8.1f}MB"
+    )
+
+
+def run(solvers, repeat, jobs=1, timeout=None, history=None):
+    """Measure every solver, printing each result as it comes in.
+
+    Records are returned in discovery order whatever order they finished.
+    """
+    solvers = list(solvers)
+    if jobs == 1 and not timeout:
+        records = (measure(s, repeat) for s in solvers)
+    else:
+        order = longest_first(solvers, previous_mean_walls(history) if history else {})
+        records = run_parallel(order, repeat, jobs, timeout)
+
+    done = {}
+    for record in records:
+        print(summary_line(record), flush=True)
+        done[record["solver"]] = record
+    return [done[s.name] for s in solvers]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("days", nargs="*", help="only these days, e.g. 01 16")
+    parser.add_argument("-n", "--repeat", type=int, default=1)
+    parser.add_argument("-o", "--output", type=Path, default=Path("bench.json"))
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, help="worker processes, 0 for all cores"
+    )
+    parser.add_argument("--timeout", type=float, help="seconds allowed per part")
+    parser.add_argument(
+        "--history",
+        type=Path,
+        help="earlier report used to start slow parts first (default: --output)",
+    )
+    args = parser.parse_args(argv)
+
+    jobs = args.jobs or os.cpu_count()
+    history = args.history or args.output
+    results = run(discover(days=args.days), args.repeat, jobs, args.timeout, history)
+    report = {**environment(), "results": results}
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+
+# --> Test driven development helpers
+
+
+def test_measure():
+    record = measure(Solver(DAYS / "01" / "part1.py", "solve"), repeat=2)
+    assert record["status"] == "ok"
+    assert len(record["wall"]) == len(record["cpu"]) == 2
+    assert record["peak_rss_kb"] > 0
+
+
+def test_measure_without_input(tmp_path):
+    script = tmp_path / "99" / "part1.py"
+    script.parent.mkdir()
+    script.write_text("def solve(input_data):\n    return 0\n")
+    assert measure(Solver(script, "solve"))["status"] == "no input"
+
+
+def fake_day(tmp_path, day, source):
+    script = tmp_path / day / "part1.py"
+    script.parent.mkdir()
+    script.write_text(source)
+    (script.parent / "input.txt").write_text("")
+    return Solver(script, "solve")
+
+
+def test_timeout(tmp_path):
+    solver = fake_day(tmp_path, "97", "def solve(input_data):\n    while True: pass\n")
+    assert measure(solver, timeout=0.1)["status"] == "timeout"
+
+
+def test_parent_kills_overrunning_worker(tmp_path):
+    # with SIGALRM blocked, as during a long C call, only the parent can stop it
+    source = (
+        "import signal\n"
+        "def solve(input_data):\n"
+        "    signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGALRM})\n"
+        "    while True: pass\n"
+    )
+    stuck = fake_day(tmp_path, "94", source)
+    ok = fake_day(tmp_path, "93", "def solve(input_data):\n    return 42\n")
+    records = {r["solver"]: r for r in run_parallel([stuck, ok], 1, 1, timeout=0.1)}
+    assert records[stuck.name]["status"] == "timeout"
+    assert records[ok.name]["status"] == "ok"
+
+
+def test_parallel_isolates_crashes(tmp_path):
+    ok = fake_day(tmp_path, "96", "def solve(input_data):\n    return 42\n")
+    crash = fake_day(
+        tmp_path, "95", "import os\ndef solve(input_data):\n    os._exit(1)\n"
+    )
+    records = {r["solver"]: r for r in run_parallel([crash, ok], 1, jobs=2)}
+    assert records[crash.name]["status"] == "crashed"
+    assert records[ok.name]["status"] == "ok"
+
+
+def test_longest_first():
+    fast, slow, new = (Solver(Path(f"{n}/part1.py"), "solve") for n in "123")
+    mean_walls = {fast.name: 0.1, slow.name: 10.0}
+    assert longest_first([fast, slow, new], mean_walls) == [new, slow, fast]
+
+
+def test_previous_mean_walls(tmp_path):
+    report = tmp_path / "bench.json"
+    record = {"solver": "01/part1.py:solve", "status": "ok", "repeat": 2}
+    report.write_text(json.dumps({"results": [{**record, "wall": [1.0, 3.0]}]}))
+    assert previous_mean_walls(report) == {"01/part1.py:solve": 2.0}
+    assert previous_mean_walls(tmp_path / "missing.json") == {}
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,348 @@
+"""Disk cache of solve() results keyed by input, solver source and arguments
+
+    python -m advent_2022.cache list [SOLVER]
+    python -m advent_2022.cache stats
+    python -m advent_2022.cache evict [SOLVER] [--keep-bytes N]
+    python -m advent_2022.cache clear
+
+A result is stored under the hash of the input text, the hash of the source
+files the solver comes from and uses, and the extra arguments (nrounds,
+key_row, part...). Editing a solver or a helper it uses, in days/ or in
+advent_2022/, changes its source hash, so only those solvers' entries stop
+matching; they are dropped the next time it stores a result.
+The cache is capped in bytes and evicts least recently used entries.
+
+The database lives in $ADVENT_CACHE_DIR, or advent_2022/ under the user's
+cache directory.
+"""
+import argparse
+import hashlib
+import inspect
+import os
+import pickle
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+from advent_2022.solvers import DAYS
+
+PACKAGE = Path(__file__).resolve().parent
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    solver TEXT NOT NULL,
+    source_hash TEXT NOT NULL,
+    input_hash TEXT NOT NULL,
+    args TEXT NOT NULL,
+    result BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+
+
+def default_path():
+    if "ADVENT_CACHE_DIR" in os.environ:
+        root = Path(os.environ["ADVENT_CACHE_DIR"])
+    else:
+        xdg = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+        root = Path(xdg) / "advent_2022"
+    return root / "results.sqlite"
+
+
+# --> Keys
+
+
+def sha256_of(data):
+    """Hash puzzle input given as text, bytes or a path to the file"""
+    digest = hashlib.sha256()
+    if isinstance(data, str):
+        digest.update(data.encode())
+    elif isinstance(data, (bytes, bytearray, memoryview)):
+        digest.update(data)
+    else:
+        with open(data, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def source_files(solve):
+    """The file solve is defined in plus every module of ours it reaches.
+
+    Day 19's parts get solve() from solution.py, later days pull helpers
+    from modules next to the part scripts, and the numpy solvers parse
+    through advent_2022.loader; a change to any of those has to invalidate
+    the solver's results. Modules are followed through their globals, the
+    modules they import and the modules their functions and classes come
+    from, as long as they live next to solve's file, in days/ or in
+    advent_2022/.
+    """
+    main_file = Path(inspect.getsourcefile(solve)).resolve()
+    roots = (main_file.parent, DAYS.resolve(), PACKAGE)
+    files = {main_file}
+    seen = set()
+    todo = [sys.modules.get(solve.__module__)]
+    while todo:
+        module = todo.pop()
+        if module is None or module.__name__ in seen:
+            continue
+        seen.add(module.__name__)
+        path = getattr(module, "__file__", None)
+        if not path:
+            continue
+        path = Path(path).resolve()
+        if not any(path.is_relative_to(root) for root in roots):
+            continue
+        files.add(path)
+        for value in vars(module).values():
+            if inspect.ismodule(value):
+                todo.append(value)
+                continue
+            name = getattr(value, "__module__", None)
+            if isinstance(name, str):
+                todo.append(sys.modules.get(name))
+    return sorted(files)
+
+
+def solver_name(solve):
+    path = Path(inspect.getsourcefile(solve))
+    return f"{path.parent.name}/{path.name}:{solve.__qualname__}"
+
+
+def source_hash(solve):
+    digest = hashlib.sha256()
+    for path in source_files(solve):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+# --> Storage
+
+
+class ResultCache:
+    def __init__(self, path=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = Path(path) if path else default_path()
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(self.path, timeout=30)
+        self.db.execute(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def call(self, solve, input_data, *args):
+        """solve(input_data, *args), from the cache when possible"""
+        solver = solver_name(solve)
+        source = source_hash(solve)
+        inputs = sha256_of(input_data)
+        # solve1 and solve2 share a source file, so the name is part of the key
+        key = f"{solver}:{inputs}:{source}:{args!r}"
+        key = hashlib.sha256(key.encode()).hexdigest()
+
+        row = self.db.execute(
+            "SELECT result FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is not None:
+            with self.db:
+                self.db.execute(
+                    "UPDATE results SET last_used = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+            return pickle.loads(row[0])
+
+        result = solve(input_data, *args)
+        self.put(key, solver, source, inputs, args, result)
+        return result
+
+    def put(self, key, solver, source, inputs, args, result):
+        blob = pickle.dumps(result)
+        now = time.time()
+        with self.db:
+            # results from an older version of this solver can never hit again
+            self.db.execute(
+                "DELETE FROM results WHERE solver = ? AND source_hash != ?",
+                (solver, source),
+            )
+            self.db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, solver, source, inputs, repr(args), blob, len(blob), now, now),
+            )
+        self.shrink(self.max_bytes)
+
+    def shrink(self, max_bytes):
+        """Drop least recently used entries until the total fits max_bytes"""
+        rows = self.db.execute(
+            "SELECT key, size FROM results ORDER BY last_used DESC"
+        ).fetchall()
+        total = 0
+        doomed = []
+        for key, size in rows:
+            total += size
+            if total > max_bytes:
+                doomed.append((key,))
+        with self.db:
+            self.db.executemany("DELETE FROM results WHERE key = ?", doomed)
+        return len(doomed)
+
+    def entries(self, solver=None):
+        query = "SELECT solver, args, input_hash, size, last_used FROM results"
+        params = ()
+        if solver:
+            query += " WHERE solver LIKE ?"
+            params = (f"%{solver}%",)
+        return self.db.execute(query + " ORDER BY solver, last_used", params).fetchall()
+
+    def evict(self, solver):
+        with self.db:
+            cursor = self.db.execute(
+                "DELETE FROM results WHERE solver LIKE ?", (f"%{solver}%",)
+            )
+        return cursor.rowcount
+
+    def clear(self):
+        with self.db:
+            cursor = self.db.execute("DELETE FROM results")
+        return cursor.rowcount
+
+    def stats(self):
+        count, total = self.db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()
+        return {"entries": count, "bytes": total, "max_bytes": self.max_bytes}
+
+
+# --> Command line
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", type=Path, help="cache database to use")
+    commands = parser.add_subparsers(dest="command", required=True)
+    listing = commands.add_parser("list", help="show cached results")
+    listing.add_argument("solver", nargs="?", help="e.g. 11/part2 or solve1")
+    commands.add_parser("stats", help="entry count and size")
+    evict = commands.add_parser("evict", help="drop one solver's results")
+    evict.add_argument("solver", nargs="?")
+    evict.add_argument("--keep-bytes", type=int, help="or shrink LRU to this size")
+    commands.add_parser("clear", help="drop everything")
+    args = parser.parse_args(argv)
+
+    cache = ResultCache(args.path)
+    if args.command == "list":
+        for solver, solve_args, input_hash, size, last_used in cache.entries(
+            args.solver
+        ):
+            used = time.strftime("%Y-%m-%d %H:%M", time.localtime(last_used))
+            print(f"{solver:<28} {solve_args:<16} {input_hash[:12]} {size:>8}B {used}")
+    elif args.command == "stats":
+        for name, value in cache.stats().items():
+            print(f"{name:<10} {value}")
+    elif args.command == "evict":
+        if args.keep_bytes is not None:
+            print(f"evicted {cache.shrink(args.keep_bytes)}")
+        elif args.solver:
+            print(f"evicted {cache.evict(args.solver)}")
+        else:
+            parser.error("evict needs a SOLVER or --keep-bytes")
+    elif args.command == "clear":
+        print(f"evicted {cache.clear()}")
+    cache.close()
+
+
+# --> Test driven development helpers
+
+
+def counting_solver(tmp_path, body="return len(input_data) + bonus"):
+    from advent_2022.solvers import load_module
+
+    script = tmp_path / "98" / "part1.py"
+    script.parent.mkdir(exist_ok=True)
+    script.write_text(
+        f"calls = []\n\n\ndef solve(input_data, bonus=0):\n"
+        f"    calls.append(input_data)\n    {body}\n"
+    )
+    sys.modules.pop("day98_part1", None)
+    return load_module(script)
+
+
+def test_hit_and_miss(tmp_path):
+    module = counting_solver(tmp_path)
+    cache = ResultCache(tmp_path / "cache.sqlite")
+
+    assert cache.call(module.solve, "abc") == 3
+    assert cache.call(module.solve, "abc") == 3
+    assert cache.call(module.solve, "abc", 10) == 13
+    assert cache.call(module.solve, "abcd") == 4
+    assert module.calls == ["abc", "abc", "abcd"]
+
+
+def test_edit_invalidates_only_that_solver(tmp_path):
+    cache = ResultCache(tmp_path / "cache.sqlite")
+    module = counting_solver(tmp_path)
+    cache.call(module.solve, "abc")
+    cache.put("other", "01/part1.py:solve", "x", "y", (), 1)
+
+    edited = counting_solver(tmp_path, body="return 2 * len(input_data)")
+    assert cache.call(edited.solve, "abc") == 6
+    assert edited.calls == ["abc"]
+    assert [row[0] for row in cache.entries()] == [
+        "01/part1.py:solve",
+        "98/part1.py:solve",
+    ]
+
+
+def test_functions_in_one_file_dont_share(tmp_path):
+    module = counting_solver(tmp_path)
+    cache = ResultCache(tmp_path / "cache.sqlite")
+
+    def solve2(input_data):
+        return -module.solve(input_data)
+
+    solve2.__module__ = module.__name__
+    solve2.__code__ = solve2.__code__.replace(co_filename=module.__file__)
+    assert cache.call(module.solve, "abc") == 3
+    assert cache.call(solve2, "abc") == -3
+
+
+def test_shared_helpers_are_part_of_the_key(monkeypatch):
+    from advent_2022 import loader
+    from advent_2022.solvers import load_module
+
+    solve = load_module(DAYS / "01" / "calories_numpy.py").solve1
+    loader_file = Path(loader.__file__).resolve()
+    assert loader_file in source_files(solve)
+
+    before = source_hash(solve)
+    read_bytes = Path.read_bytes
+
+    def edited(path):
+        data = read_bytes(path)
+        return data + b"\n# edited\n" if path == loader_file else data
+
+    monkeypatch.setattr(Path, "read_bytes", edited)
+    assert source_hash(solve) != before
+
+
+def test_lru_cap(tmp_path):
+    module = counting_solver(tmp_path)
+    cache = ResultCache(tmp_path / "cache.sqlite", max_bytes=100)
+    for text in ("a", "bb", "ccc"):
+        cache.call(module.solve, text)
+    cache.call(module.solve, "a")  # refresh "a"
+    cache.shrink(2 * cache.stats()["bytes"] // 3)
+
+    module.calls.clear()
+    cache.call(module.solve, "a")
+    cache.call(module.solve, "ccc")
+    cache.call(module.solve, "bb")
+    assert module.calls == ["bb"]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Drop-in for icecream's ic() that imports icecream only once it's enabled
+
+icecream brings in pygments, executing and asttokens, which used to be the
+bulk of a solver's import time. The trace is only wanted during the TDD
+runs, so it starts disabled and the import waits for ic.enable().
+
+A disabled ic(x) still evaluates x and makes a call. Inside hot loops write
+
+    if __debug__ and ic.enabled:
+        ic(stacks)
+
+which costs one attribute check, and nothing at all under `python -O`:
+the compiler drops the whole statement when __debug__ is False.
+"""
+import sys
+
+
+class LazyIc:
+    def __init__(self):
+        self.enabled = False
+        self._ic = None
+
+    def _load(self):
+        if self._ic is None:
+            from icecream import IceCreamDebugger
+
+            self._ic = IceCreamDebugger()
+        return self._ic
+
+    def __call__(self, *args):
+        if self.enabled:
+            # format against the caller's frame, not ours, so the output
+            # shows the expressions at the ic() call site
+            real_ic = self._load()
+            real_ic.outputFunction(real_ic._format(sys._getframe(1), *args))
+
+        if not args:
+            return None
+        if len(args) == 1:
+            return args[0]
+        return args
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def configureOutput(self, **kwargs):
+        self._load().configureOutput(**kwargs)
+
+
+ic = LazyIc()
+
+
+# --> Test driven development helpers
+
+
+def test_disabled_is_passthrough():
+    trace = LazyIc()
+    assert trace() is None
+    assert trace(1) == 1
+    assert trace(1, 2) == (1, 2)
+    assert trace._ic is None
+
+
+def test_guarded_trace_compiles_out():
+    import dis
+
+    source = "if __debug__ and ic.enabled:\n    ic(expensive())\n"
+    traced = compile(source, "<trace>", "exec", optimize=0)
+    production = compile(source, "<trace>", "exec", optimize=1)
+    assert "ic" in traced.co_names
+    assert not any(i.argval == "ic" for i in dis.get_instructions(production))
+
+
+def test_enabled_shows_call_site():
+    lines = []
+    trace = LazyIc()
+    trace.configureOutput(outputFunction=lines.append)
+    trace.enable()
+    answer = 42
+    assert trace(answer) == 42
+    assert lines == ["ic| answer: 42"]
@@ -0,0 +1,550 @@
+"""Seeded puzzle inputs of any size, for seeing how solvers scale
+
+    python -m advent_2022.generate 01 1000000 -o calories.txt
+    python -m advent_2022.generate 06 1000000000 --seed 7 -o stream.txt
+
+`size` is in each day's natural unit: lines of calories, characters of
+datastream, directories, trees along one side of the forest, moves,
+valves, numbers to mix... Output is valid for both parts and is written a
+chunk at a time, so a gigabyte of day 6 never sits in memory.
+
+Day 15's part 2 expects the sensors to leave exactly one gap; random
+sensors leave many, so only part 1 is meaningful on generated input.
+"""
+import argparse
+import json
+import math
+import random
+import string
+import sys
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+CHUNK_LINES = 10_000
+
+
+def lines(size, make_line):
+    """size lines from make_line(), joined a chunk at a time"""
+    while size > 0:
+        n = min(size, CHUNK_LINES)
+        yield "".join(make_line() + "\n" for _ in range(n))
+        size -= n
+
+
+def rows(side, make_cell):
+    for _ in range(side):
+        yield "".join(make_cell() for _ in range(side)) + "\n"
+
+
+# --> One generator per day
+
+
+def calories(size, rng):
+    first = True
+    while size > 0:
+        n = min(size, rng.randint(1, 15))
+        size -= n
+        yield ("" if first else "\n") + "".join(
+            f"{rng.randint(1000, 60000)}\n" for _ in range(n)
+        )
+        first = False
+
+
+def strategy_guide(size, rng):
+    yield from lines(size, lambda: f"{rng.choice('ABC')} {rng.choice('XYZ')}")
+
+
+def rucksacks(size, rng):
+    """Groups of three sharing exactly one badge; halves share one item each"""
+    letters = string.ascii_letters
+    for _ in range(-(-size // 3)):
+        badge = rng.choice(letters)
+        others = [ch for ch in letters if ch != badge]
+        rng.shuffle(others)
+        group = []
+        for own in (others[:17], others[17:34], others[34:51]):
+            shared, first, second = own[0], own[1:9], own[9:17]
+            half = rng.randint(4, 16)
+            left = [badge, shared] + rng.choices(first, k=half - 2)
+            right = [shared] + rng.choices(second, k=half - 1)
+            rng.shuffle(left)
+            rng.shuffle(right)
+            group.append("".join(left + right) + "\n")
+        yield "".join(group)
+
+
+def section_pairs(size, rng, top=99, width=None):
+    """width caps each range's length; by default a range runs to any
+    section up to top"""
+
+    def section():
+        lo = rng.randint(1, top)
+        hi = top if width is None else min(top, lo + width - 1)
+        return f"{lo}-{rng.randint(lo, hi)}"
+
+    yield from lines(size, lambda: f"{section()},{section()}")
+
+
+def crane_moves(size, rng, nstacks=9, depth=8):
+    stacks = [
+        [rng.choice(string.ascii_uppercase) for _ in range(rng.randint(2, depth))]
+        for _ in range(nstacks)
+    ]
+    for level in reversed(range(max(map(len, stacks)))):
+        cells = [f"[{s[level]}]" if level < len(s) else "   " for s in stacks]
+        yield " ".join(cells).rstrip() + "\n"
+    yield " ".join(f" {i} " for i in range(1, nstacks + 1)) + "\n\n"
+
+    # track heights only; never empty a stack so every part has a top crate
+    heights = [len(s) for s in stacks]
+
+    def move():
+        source = rng.choice([i for i, h in enumerate(heights) if h > 1])
+        dest = rng.choice([i for i in range(nstacks) if i != source])
+        qty = rng.randint(1, min(heights[source] - 1, 30))
+        heights[source] -= qty
+        heights[dest] += qty
+        return f"move {qty} from {source + 1} to {dest + 1}"
+
+    yield from lines(size, move)
+
+
+def datastream(size, rng):
+    """Three letters repeated, so no marker turns up until the very end"""
+    marker = string.ascii_lowercase[3:17]
+    body = max(size - len(marker), 0)
+    while body > 0:
+        n = min(body, CHUNK_LINES * 100)
+        yield "".join(rng.choices("abc", k=n))
+        body -= n
+    yield marker + "\n"
+
+
+def terminal_log(size, rng):
+    """size directories, often nested in the one just made, so deep too"""
+    parents = [None] + [
+        i - 1 if rng.random() < 0.5 else rng.randrange(i) for i in range(1, size)
+    ]
+    children = [[] for _ in range(size)]
+    for child, parent in enumerate(parents[1:], start=1):
+        children[parent].append(child)
+
+    yield "$ cd /\n"
+    todo = [0]
+    while todo:
+        node = todo.pop()
+        if node is None:
+            yield "$ cd ..\n"
+            continue
+        if node:
+            yield f"$ cd d{node}\n"
+        out = ["$ ls\n"]
+        out += [f"dir d{child}\n" for child in children[node]]
+        out += [
+            f"{rng.randint(1, 300_000)} f{k}.{rng.choice(['txt', 'dat', 'log'])}\n"
+            for k in range(rng.randint(0, 4))
+        ]
+        yield "".join(out)
+        if node:
+            todo.append(None)
+        todo.extend(reversed(children[node]))
+
+
+def forest(size, rng):
+    yield from rows(size, lambda: rng.choice(string.digits))
+
+
+def rope_moves(size, rng):
+    yield from lines(size, lambda: f"{rng.choice('LRUD')} {rng.randint(1, 19)}")
+
+
+def cpu_program(size, rng):
+    def instruction():
+        if rng.random() < 0.3:
+            return "noop"
+        return f"addx {rng.randint(-20, 20)}"
+
+    yield from lines(size, instruction)
+
+
+def monkeys(size, rng, count=8):
+    """size items spread over eight monkeys with the usual sort of rules"""
+    tests = rng.sample([2, 3, 5, 7, 11, 13, 17, 19, 23], count)
+    operations = ["old * old"] + [
+        f"old {rng.choice('+*')} {rng.randint(1, 19)}" for _ in range(count - 1)
+    ]
+    rng.shuffle(operations)
+    items = [[] for _ in range(count)]
+    for i in range(max(size, count)):
+        # everyone starts with at least one item
+        owner = i if i < count else rng.randrange(count)
+        items[owner].append(str(rng.randint(50, 99)))
+
+    for i in range(count):
+        true_, false_ = rng.sample([m for m in range(count) if m != i], 2)
+        yield (
+            ("\n" if i else "")
+            + f"Monkey {i}:\n"
+            + f"  Starting items: {', '.join(items[i])}\n"
+            + f"  Operation: new = {operations[i]}\n"
+            + f"  Test: divisible by {tests[i]}\n"
+            + f"    If true: throw to monkey {true_}\n"
+            + f"    If false: throw to monkey {false_}\n"
+        )
+
+
+def heightmap(size, rng):
+    """A slope from a to z, with pits; E's row is pit free so E is reachable"""
+    width = max(size, 26)
+    height = max(width // 4, 3)
+    path_row = rng.randrange(height)
+    for row in range(height):
+        cells = []
+        for col in range(width):
+            level = col * 25 // (width - 1)
+            if row != path_row and rng.random() < 0.2:
+                level = max(level - rng.randint(2, 5), 0)
+            cells.append(string.ascii_lowercase[level])
+        if row == path_row:
+            cells[0], cells[-1] = "S", "E"
+        yield "".join(cells) + "\n"
+
+
+def packet_key(packet):
+    """Packets with equal keys compare as neither in nor out of order"""
+    if isinstance(packet, int):
+        return ("int", packet)
+    key = tuple(packet_key(item) for item in packet)
+    # [n], [[n]]... compare equal to n itself
+    if len(key) == 1 and key[0][0] == "int":
+        return key[0]
+    return ("list", key)
+
+
+def packets(size, rng):
+    """size pairs, all distinct: day 13's sort never settles on a tie"""
+
+    def packet(depth=0):
+        if depth and (depth > 3 or rng.random() < 0.4):
+            return rng.randint(0, 10)
+        return [packet(depth + 1) for _ in range(rng.randint(0, 4))]
+
+    seen = {packet_key([[2]]), packet_key([[6]])}
+
+    def new_packet():
+        while True:
+            candidate = packet()
+            key = packet_key(candidate)
+            if key not in seen:
+                seen.add(key)
+                return json.dumps(candidate, separators=(",", ":"))
+
+    for i in range(size):
+        yield ("\n" if i else "") + new_packet() + "\n" + new_packet() + "\n"
+
+
+def rock_paths(size, rng):
+    """size paths in a cave that widens and deepens with the square root"""
+    spread = 20 + 4 * math.isqrt(size)
+
+    def path():
+        x, y = 500 + rng.randint(-spread, spread), rng.randint(2, spread)
+        points = [(x, y)]
+        for k in range(rng.randint(1, 4)):
+            if k % 2:
+                y = min(max(y + rng.randint(-6, 6), 2), spread)
+            else:
+                x += rng.randint(-6, 6)
+            points.append((x, y))
+        return " -> ".join(f"{x},{y}" for x, y in points)
+
+    yield from lines(size, path)
+
+
+def sensors(size, rng):
+    def sensor():
+        x, y = rng.randint(0, 4_000_000), rng.randint(0, 4_000_000)
+        dx = rng.randint(-300_000, 300_000)
+        dy = rng.randint(-300_000, 300_000)
+        return f"Sensor at x={x}, y={y}: closest beacon is at x={x + dx}, y={y + dy}"
+
+    yield from lines(size, sensor)
+
+
+def valve_name(i):
+    letters = string.ascii_uppercase
+    width = 2 if i < 26**2 else 3
+    return "".join(letters[(i // 26**k) % 26] for k in reversed(range(width)))
+
+
+def valves(size, rng):
+    """A connected cave of size valves, at most 15 of them worth opening"""
+    size = max(size, 2)
+    names = [valve_name(i) for i in range(size)]
+    tunnels = [set() for _ in range(size)]
+    for i in range(1, size):
+        j = rng.randrange(i)
+        tunnels[i].add(j)
+        tunnels[j].add(i)
+    for _ in range(size // 2):
+        i, j = rng.sample(range(size), 2)
+        tunnels[i].add(j)
+        tunnels[j].add(i)
+    rates = [0] * size
+    for i in rng.sample(range(1, size), min(15, size - 1)):
+        rates[i] = rng.randint(3, 25)
+
+    def line(i):
+        others = ", ".join(names[j] for j in sorted(tunnels[i]))
+        if len(tunnels[i]) == 1:
+            return f"Valve {names[i]} has flow rate={rates[i]}; tunnel leads to valve {others}\n"  # noqa: E501
+        return f"Valve {names[i]} has flow rate={rates[i]}; tunnels lead to valves {others}\n"  # noqa: E501
+
+    for start in range(0, size, CHUNK_LINES):
+        yield "".join(line(i) for i in range(start, min(start + CHUNK_LINES, size)))
+
+
+def lava_cubes(size, rng):
+    side = math.ceil((2 * size) ** (1 / 3)) + 1
+    cubes = set()
+    while len(cubes) < size:
+        cubes.add(tuple(rng.randrange(side) for _ in range(3)))
+    yield "".join(f"{x},{y},{z}\n" for x, y, z in cubes)
+
+
+def blueprints(size, rng):
+    def blueprint(n):
+        return (
+            f"Blueprint {n}: "
+            f"Each ore robot costs {rng.randint(2, 4)} ore. "
+            f"Each clay robot costs {rng.randint(2, 4)} ore. "
+            f"Each obsidian robot costs {rng.randint(2, 4)} ore "
+            f"and {rng.randint(5, 20)} clay. "
+            f"Each geode robot costs {rng.randint(2, 4)} ore "
+            f"and {rng.randint(5, 20)} obsidian.\n"
+        )
+
+    yield "".join(blueprint(n) for n in range(1, max(size, 3) + 1))
+
+
+def mixing_list(size, rng):
+    """Numbers with duplicates and exactly one zero, like the real input"""
+    numbers = [rng.choice([-1, 1]) * rng.randint(1, 10_000) for _ in range(size - 1)]
+    numbers.insert(rng.randint(0, len(numbers)), 0)
+    for start in range(0, len(numbers), CHUNK_LINES):
+        yield "".join(f"{n}\n" for n in numbers[start : start + CHUNK_LINES])
+
+
+def monkey_names(count, rng):
+    """Distinct four letter names; the solvers rely on them all being four"""
+    letters = string.ascii_lowercase
+    reserved = {"root", "humn"}
+    names = []
+    for code in rng.sample(range(26**4), count + len(reserved)):
+        name = "".join(letters[(code // 26**k) % 26] for k in range(4))
+        if name not in reserved:
+            names.append(name)
+    return names[:count]
+
+
+def monkey_math(size, rng):
+    """An expression tree with about size monkeys whose divisions are exact.
+
+    Built from the root down: each job's operands are chosen so that it
+    evaluates to the value its parent needs. Root's two sides are equal, so
+    humn's own value is the part 2 answer.
+    """
+    leaves = max(size // 2, 2)
+    names = iter(monkey_names(2 * leaves, rng))
+    jobs = []
+    leaf_names = []
+    todo = [("root", 2 * rng.randint(100, 10_000), leaves)]
+    while todo:
+        name, value, budget = todo.pop()
+        if budget == 1 and name != "root":
+            jobs.append(f"{name}: {value}")
+            leaf_names.append(name)
+            continue
+        other = rng.randint(1, 10)
+        divisors = [d for d in range(2, 10) if value % d == 0]
+        ops = (
+            ["-", "/"] + (["+"] if value > other else []) + (["*"] if divisors else [])
+        )
+        op = rng.choice(ops)
+        if name == "root":
+            op, left, right = "+", value // 2, value // 2
+        elif op == "+":
+            left, right = value - other, other
+        elif op == "-":
+            left, right = value + other, other
+        elif op == "*":
+            right = rng.choice(divisors)
+            left = value // right
+        else:
+            left, right = value * (other % 4 + 2), other % 4 + 2
+        split = rng.randint(1, budget - 1)
+        a, b = next(names), next(names)
+        jobs.append(f"{name}: {a} {op} {b}")
+        todo.append((a, left, split))
+        todo.append((b, right, budget - split))
+
+    # one leaf becomes humn; names are all four letters so replace is safe
+    victim = rng.choice(leaf_names)
+    renamed = [job.replace(victim, "humn") for job in jobs]
+    rng.shuffle(renamed)
+    for start in range(0, len(renamed), CHUNK_LINES):
+        yield "".join(job + "\n" for job in renamed[start : start + CHUNK_LINES])
+
+
+def board_path(size, rng):
+    side = max(size, 4)
+    yield from rows(side, lambda: "#" if rng.random() < 0.1 else ".")
+    yield "\n"
+    steps = [str(rng.randint(1, 50))]
+    for _ in range(side * 4):
+        steps += [rng.choice("LR"), str(rng.randint(1, 50))]
+    yield "".join(steps) + "\n"
+
+
+def elves(size, rng):
+    yield from rows(max(size, 2), lambda: "#" if rng.random() < 0.5 else ".")
+
+
+def blizzards(size, rng):
+    """A valley size rows high and about five times as wide, like the real
+    one; the door columns only get horizontal blizzards so they stay open"""
+    height = max(size, 5)
+    width = 5 * height - 5
+    yield "#." + "#" * width + "\n"
+    for _ in range(height):
+        cells = []
+        for col in range(width):
+            choices = "<>" if col in (0, width - 1) else "<>^v"
+            cells.append(rng.choice(choices) if rng.random() < 0.4 else ".")
+        yield "#" + "".join(cells) + "#\n"
+    yield "#" * width + ".#\n"
+
+
+SNAFU_DIGITS = "=-012"
+
+
+def snafu(n):
+    digits = []
+    while n:
+        n, rem = divmod(n + 2, 5)
+        digits.append(SNAFU_DIGITS[rem])
+    return "".join(reversed(digits)) or "0"
+
+
+def fuel_numbers(size, rng):
+    # day 25 handles 20 SNAFU places, so keep the total well inside that
+    yield from lines(size, lambda: snafu(rng.randint(1, 5 ** rng.randint(1, 11))))
+
+
+# --> Registry
+
+
+class Generator(NamedTuple):
+    function: Callable
+    sizes: tuple  # default sizes for a scaling run, small to large
+    dims: int = 1  # 2 when size is the side of a grid
+
+
+GENERATORS = {
+    "01": Generator(calories, (10_000, 100_000, 1_000_000, 10_000_000)),
+    "02": Generator(strategy_guide, (10_000, 100_000, 1_000_000)),
+    "03": Generator(rucksacks, (3_000, 30_000, 300_000)),
+    "04": Generator(section_pairs, (10_000, 100_000, 1_000_000)),
+    "05": Generator(crane_moves, (10_000, 100_000, 1_000_000)),
+    "06": Generator(datastream, (1_000_000, 10_000_000, 100_000_000)),
+    "07": Generator(terminal_log, (1_000, 10_000, 100_000)),
+    "08": Generator(forest, (100, 300, 1000), dims=2),
+    "09": Generator(rope_moves, (2_000, 20_000, 200_000)),
+    "10": Generator(cpu_program, (10_000, 100_000, 1_000_000)),
+    "11": Generator(monkeys, (40, 400, 4_000)),
+    "12": Generator(heightmap, (100, 300, 1000), dims=2),
+    "13": Generator(packets, (150, 1_500, 15_000)),
+    "14": Generator(rock_paths, (100, 1_000, 10_000)),
+    "15": Generator(sensors, (30, 300, 3_000)),
+    "16": Generator(valves, (60, 600, 6_000)),
+    "18": Generator(lava_cubes, (3_000, 30_000, 300_000)),
+    "19": Generator(blueprints, (3, 10, 30)),
+    "20": Generator(mixing_list, (5_000, 50_000, 1_000_000)),
+    "21": Generator(monkey_math, (2_000, 20_000, 200_000)),
+    "22": Generator(board_path, (150, 500, 1_500), dims=2),
+    "23": Generator(elves, (70, 140, 280), dims=2),
+    "24": Generator(blizzards, (10, 20, 30), dims=2),
+    "25": Generator(fuel_numbers, (1_000, 10_000, 100_000)),
+}
+
+
+def chunks(day, size, seed=0):
+    return GENERATORS[day].function(size, random.Random(seed))
+
+
+def generate(day, size, seed=0):
+    return "".join(chunks(day, size, seed))
+
+
+def write(day, size, path, seed=0):
+    with open(path, "w") as f:
+        for chunk in chunks(day, size, seed):
+            f.write(chunk)
+    return Path(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("day", choices=sorted(GENERATORS))
+    parser.add_argument("size", type=lambda s: int(float(s)), help="e.g. 1e6")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", type=Path, help="default stdout")
+    args = parser.parse_args(argv)
+
+    if args.output:
+        write(args.day, args.size, args.output, args.seed)
+    else:
+        for chunk in chunks(args.day, args.size, args.seed):
+            sys.stdout.write(chunk)
+
+
+# --> Test driven development helpers
+
+
+def test_seeded():
+    assert generate("01", 50, seed=3) == generate("01", 50, seed=3)
+    assert generate("01", 50, seed=3) != generate("01", 50, seed=4)
+
+
+def test_sizes():
+    calories = generate("01", 1000)
+    assert calories.count("\n") - calories.count("\n\n") == 1000
+    assert len(generate("06", 10_000)) == 10_001
+    assert [len(row) for row in generate("08", 7).splitlines()] == [7] * 7
+    assert len(generate("20", 123).splitlines()) == 123
+
+
+def test_snafu():
+    assert [snafu(n) for n in (1, 3, 10, 2022, 314159265)] == [
+        "1",
+        "1=",
+        "20",
+        "1=11-2",
+        "1121-1110-1=0",
+    ]
+
+
+def test_every_day_solves():
+    # the real solvers accept small generated inputs
+    from advent_2022.solvers import discover
+
+    slow = {"15/part2.py:solve", "19/solution.py:solve"}
+    for solver in discover(days=list(GENERATORS)):
+        if solver.key in slow:
+            continue
+        size = GENERATORS[solver.day].sizes[0] // 10 or 1
+        solver(generate(solver.day, size))
+
+
+if __name__ == "__main__":
+    main()
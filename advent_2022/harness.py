@@ -0,0 +1,138 @@
+"""The `if __name__ == "__main__"` block every day used to carry
+
+Run the examples under pytest with the debug trace on, then solve the real
+input with it off. pytest is imported here, inside the functions, so a
+solver module can be imported without paying for it.
+
+Answers for the real input come from advent_2022.cache when the input and
+the solver's source are unchanged; pass --no-cache to always recompute.
+--profile [cprofile|sample] skips the cache and writes a time and
+allocation profile next to the script (see advent_2022.profiling).
+"""
+import re
+import sys
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+
+from advent_2022.debug import ic
+
+DEFAULT_PYTEST_ARGS = ("--capture=tee-sys", "-v")
+
+
+def run_tests(test_file, pytest_args=DEFAULT_PYTEST_ARGS, trace=True):
+    """Run the examples in test_file, exiting the script if any fail.
+
+    trace=False keeps the debug trace off for the examples too.
+    """
+    import pytest
+
+    #  Run the test examples with icecream debug-trace turned on
+    if trace:
+        ic.enable()
+    ex = pytest.main([test_file, *pytest_args])
+    if ex != pytest.ExitCode.OK and ex != pytest.ExitCode.NO_TESTS_COLLECTED:
+        print(f"tests FAILED ({ex})")
+        sys.exit(1)
+    else:
+        print("tests PASSED")
+
+    #  Actual input data generally has more iterations, turn off log
+    ic.disable()
+
+
+def read_input(path=None):
+    """The puzzle input as text, or mapped into memory with --mmap"""
+    opts = options()
+    path = path or opts.input
+    if opts.mmap:
+        from advent_2022.loader import MappedInput
+
+        return MappedInput(path)
+    return Path(path).read_text()
+
+
+@contextmanager
+def open_input(path=None):
+    """read_input() for a with block: with --mmap, the mapping and its file
+    are closed when the block ends rather than left open for the rest of
+    the process"""
+    input_data = read_input(path)
+    try:
+        yield input_data
+    finally:
+        if not isinstance(input_data, str):
+            input_data.close()
+
+
+def options(argv=None):
+    """Flags every day's script accepts"""
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--no-cache", action="store_true", help="recompute instead of reusing"
+    )
+    parser.add_argument("--input", default="input.txt", help="puzzle input file")
+    parser.add_argument(
+        "--mmap",
+        action="store_true",
+        help="stream the input from a memory map (days 1-5 and 11)",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="cprofile",
+        choices=("cprofile", "sample"),
+        help="profile solve() instead of using the cache",
+    )
+    return parser.parse_args(argv)
+
+
+def profile_path(solve, *args):
+    """days/19/solution.py, solve(2) -> days/19/solution.solve.2.profile.txt"""
+    import inspect
+
+    script = Path(inspect.getsourcefile(solve))
+    parts = [script.stem, solve.__qualname__, *(repr(arg) for arg in args)]
+    name = ".".join(re.sub(r"[^\w-]+", "_", part).strip("_") for part in parts)
+    return script.with_name(f"{name}.profile.txt")
+
+
+def run_solver(solve, input_data, *args):
+    opts = options()
+    if opts.profile:
+        from advent_2022.profiling import profile_call
+
+        output = profile_path(solve, *args)
+        result = profile_call(
+            solve, input_data, *args, mode=opts.profile, output=output
+        )
+        print(f"profile written to {output}")
+        return result
+
+    if opts.no_cache:
+        return solve(input_data, *args)
+
+    from advent_2022.cache import ResultCache
+
+    cache = ResultCache()
+    try:
+        return cache.call(solve, input_data, *args)
+    finally:
+        cache.close()
+
+
+def main(test_file, solve, *args, pytest_args=DEFAULT_PYTEST_ARGS, debug_log=None):
+    """Test, then print solve(input.txt, *args).
+
+    debug_log sends the trace to a file instead of stderr.
+    """
+    with ExitStack() as stack:
+        if debug_log:
+            log = stack.enter_context(Path(debug_log).open("w"))
+            ic.configureOutput(outputFunction=lambda stuff: log.write(stuff + "\n"))
+
+        run_tests(test_file, pytest_args)
+        input_data = stack.enter_context(open_input())
+        result = run_solver(solve, input_data, *args)
+        print(result)
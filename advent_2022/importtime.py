@@ -0,0 +1,140 @@
+"""Check that importing a day's solver module stays cheap
+
+    python -m advent_2022.importtime --save    # record a baseline
+    python -m advent_2022.importtime           # exit 1 if any day regressed
+
+Each module is imported in a fresh `python -X importtime` process and its
+cumulative import time, everything it pulled in, is the best of --repeat
+runs. A day has regressed when it is more than --tolerance slower than the
+baseline *and* more than --slack milliseconds slower, so timer noise on
+imports that take a couple of milliseconds doesn't trip the check.
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from advent_2022.solvers import DAYS, discover
+
+
+def parse_importtime(stderr, module):
+    """Cumulative microseconds for `module` from -X importtime output"""
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_us, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative_us)
+    raise ValueError(f"{module} not found in -X importtime output")
+
+
+def import_cost_us(path, repeat=3):
+    path = Path(path)
+    code = f"import sys; sys.path.insert(0, {str(path.parent)!r}); import {path.stem}"
+    costs = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=path.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        costs.append(parse_importtime(out.stderr, path.stem))
+    return min(costs)
+
+
+def module_paths(days=None):
+    seen = []
+    for solver in discover(days=days):
+        if solver.path not in seen:
+            seen.append(solver.path)
+    return seen
+
+
+def regressions(current, baseline, tolerance, slack_us):
+    for key, cost in current.items():
+        before = baseline.get(key)
+        if before is None:
+            continue
+        if cost > before * (1 + tolerance) and cost - before > slack_us:
+            yield key, before, cost
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("days", nargs="*", help="only these days, e.g. 01 16")
+    parser.add_argument("-b", "--baseline", type=Path, default=Path("importtime.json"))
+    parser.add_argument("--save", action="store_true", help="write a new baseline")
+    parser.add_argument("-n", "--repeat", type=int, default=3)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--slack", type=float, default=5.0, help="milliseconds")
+    args = parser.parse_args(argv)
+    if not args.save and not args.baseline.exists():
+        parser.error(f"no baseline at {args.baseline}; run with --save first")
+
+    current = {}
+    for path in module_paths(args.days):
+        key = f"{path.parent.name}/{path.name}"
+        current[key] = import_cost_us(path, args.repeat)
+        print(f"{key:<20} {current[key] / 1000:8.1f}ms", flush=True)
+
+    if args.save:
+        args.baseline.write_text(json.dumps(current, indent=2) + "\n")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    failed = list(regressions(current, baseline, args.tolerance, args.slack * 1000))
+    for key, before, after in failed:
+        print(f"REGRESSED {key}: {before / 1000:.1f}ms -> {after / 1000:.1f}ms")
+    return 1 if failed else 0
+
+
+# --> Test driven development helpers
+
+SAMPLE_IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       350 |       2150 |     numpy
+import time:        40 |       2300 | part1
+"""
+
+
+def test_parse_importtime():
+    assert parse_importtime(SAMPLE_IMPORTTIME, "part1") == 2300
+    assert parse_importtime(SAMPLE_IMPORTTIME, "numpy") == 2150
+
+
+def test_regressions():
+    baseline = {"a": 1000, "b": 100_000, "c": 100_000}
+    current = {"a": 3000, "b": 200_000, "c": 110_000, "new": 1}
+    # a is 3x slower but only by 2ms; c is within tolerance
+    assert list(regressions(current, baseline, 0.25, 5000)) == [("b", 100_000, 200_000)]
+
+
+def test_missing_baseline(tmp_path, capsys):
+    import pytest
+
+    with pytest.raises(SystemExit):
+        main(["01", "-b", str(tmp_path / "nonexist.json")])
+    assert "run with --save first" in capsys.readouterr().err
+
+
+def test_solver_import_is_cheap():
+    # the examples and icecream stay out of a plain import
+    code = (
+        "import sys, part1; print('pytest' in sys.modules, 'icecream' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=DAYS / "05",
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert out.stdout.split() == ["False", "False"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+"""Read puzzle input as a stream of lines instead of one big string
+
+    from advent_2022.loader import blocks, lines
+
+    for line in lines(input_data): ...
+
+lines() and blocks() take either the usual input string or a MappedInput,
+the input file mapped read-only into memory. Over a mapping, lines are
+decoded a chunk of about a megabyte at a time, so a solver that only looks
+at one line (or one blank-line separated block) at a time runs in constant
+memory however large the file is. Scripts hand solve() a MappedInput when
+run with --mmap.
+
+Solvers that work on the raw bytes instead take as_bytes(input_data), which
+is the same for either kind of input, or byte_array() and numbers_before()
+to parse it with numpy.
+"""
+import mmap
+import os
+from pathlib import Path
+
+CHUNK_SIZE = 1 << 20
+NEWLINE = ord("\n")
+ZERO = ord("0")
+
+
+class MappedInput(os.PathLike):
+    """An input file mapped into memory; os.PathLike so it can be hashed
+    and reopened like the path it came from"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            try:
+                self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # an empty file can't be mapped
+                self.map = b""
+
+    def __fspath__(self):
+        return str(self.path)
+
+    def __repr__(self):
+        return f"MappedInput({str(self.path)!r})"
+
+    def __len__(self):
+        return len(self.map)
+
+    def as_bytes(self):
+        """The whole file as a memoryview of the mapping, no copy"""
+        return memoryview(self.map)
+
+    def _spans(self):
+        data, start, end = self.map, 0, len(self.map)
+        while start < end:
+            stop = data.find(b"\n", start)
+            if stop < 0:
+                stop = end
+            yield start, stop
+            start = stop + 1
+
+    def raw_lines(self):
+        """Lines as memoryviews into the mapping, no copies at all"""
+        view = memoryview(self.map)
+        for start, stop in self._spans():
+            yield view[start:stop]
+
+    def lines(self, chunk_size=CHUNK_SIZE):
+        """Lines as str, splitting whole chunks at once rather than line by line"""
+        data = self.map
+        if not len(data):
+            return
+        # like str.splitlines(), a final newline doesn't start another line
+        end = len(data) - 1 if data[-1:] == b"\n" else len(data)
+        start = 0
+        while True:
+            stop = end
+            if end - start > chunk_size:
+                stop = data.rfind(b"\n", start, start + chunk_size)
+                if stop < 0:
+                    # one line longer than a chunk
+                    stop = data.find(b"\n", start + chunk_size, end)
+                    stop = end if stop < 0 else stop
+            yield from data[start:stop].decode().split("\n")
+            if stop >= end:
+                return
+            start = stop + 1
+
+    def close(self):
+        if isinstance(self.map, mmap.mmap):
+            self.map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def lines(data):
+    """Like data.splitlines(), but streamed when data is a MappedInput"""
+    if isinstance(data, str):
+        return iter(data.splitlines())
+    return data.lines()
+
+
+def as_bytes(data):
+    """data as something bytes-like: a str is encoded, a path mapped, and
+    bytes are passed through"""
+    if isinstance(data, str):
+        return data.encode()
+    if isinstance(data, os.PathLike):
+        if not isinstance(data, MappedInput):
+            data = MappedInput(data)
+        return data.as_bytes()
+    return data
+
+
+def byte_array(data):
+    """as_bytes(data) as a uint8 numpy array, ending in a newline even if
+    the input doesn't"""
+    # numpy only for the solvers that use it, so `import part1` stays cheap
+    import numpy as np
+
+    array = np.frombuffer(as_bytes(data), dtype=np.uint8)
+    if array.size and array[-1] != NEWLINE:
+        array = np.append(array, np.uint8(NEWLINE))
+    return array
+
+
+def numbers_before(array, ends):
+    """(values, lengths): the number made of the digits just before each
+    index in ends, and how many digits it has (0 for none).
+
+    Numbers are built one digit position at a time, a handful of passes
+    over all of them rather than a Python int() each.
+    """
+    import numpy as np
+
+    lengths = np.diff(ends, prepend=-1) - 1
+    values = np.zeros(ends.size, dtype=np.int64)
+    place = 1
+    for back in range(1, int(lengths.max(initial=0)) + 1):
+        digits = array.take(ends - back, mode="clip")
+        digits -= ZERO
+        digits[lengths < back] = 0
+        values += digits.astype(np.int64) * place
+        place *= 10
+    return values, lengths
+
+
+def blocks(data):
+    """Blank-line separated blocks of text, each without its final newline"""
+    block = []
+    for line in lines(data):
+        if line:
+            block.append(line)
+        elif block:
+            yield "\n".join(block)
+            block = []
+    if block:
+        yield "\n".join(block)
+
+
+# --> Test driven development helpers
+
+SAMPLE = "1000\n2000\n\n4000\n\n\n5000\n6000\n"
+
+
+def test_lines_match_splitlines(tmp_path):
+    for text in (SAMPLE, SAMPLE.rstrip(), "", "\n", "one"):
+        path = tmp_path / "input.txt"
+        path.write_text(text)
+        with MappedInput(path) as mapped:
+            assert list(lines(mapped)) == text.splitlines()
+            for chunk_size in range(1, 8):
+                assert list(mapped.lines(chunk_size)) == text.splitlines()
+            assert [bytes(v) for v in mapped.raw_lines()] == [
+                line.encode() for line in text.splitlines()
+            ]
+
+
+def test_blocks(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text(SAMPLE)
+    expected = ["1000\n2000", "4000", "5000\n6000"]
+    assert list(blocks(SAMPLE)) == expected
+    assert list(blocks(MappedInput(path))) == expected
+
+
+def test_as_bytes(tmp_path):
+    path = tmp_path / "input.txt"
+    for text in (SAMPLE, ""):
+        path.write_text(text)
+        with MappedInput(path) as mapped:
+            view = as_bytes(mapped)
+            assert bytes(view) == text.encode()
+            view.release()
+        assert bytes(as_bytes(path)) == as_bytes(text) == text.encode()
+    assert as_bytes(b"ab") == b"ab"
+
+
+def test_numbers_before():
+    import numpy as np
+
+    array = byte_array("12-345,6\n\n7")
+    assert array[-1] == NEWLINE
+    ends = np.flatnonzero((array < ZERO) | (array > ZERO + 9))
+    values, lengths = numbers_before(array, ends)
+    assert values.tolist() == [12, 345, 6, 0, 7]
+    assert lengths.tolist() == [2, 3, 1, 0, 1]
+    assert byte_array("").size == 0
+
+
+def test_hashes_like_its_path(tmp_path):
+    from advent_2022.cache import sha256_of
+
+    path = tmp_path / "input.txt"
+    path.write_text(SAMPLE)
+    assert sha256_of(MappedInput(path)) == sha256_of(SAMPLE)
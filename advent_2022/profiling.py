@@ -0,0 +1,196 @@
+"""Profile one solve() call: where the time goes and where memory is allocated
+
+Scripts run this with `--profile` (cProfile, exact call counts) or
+`--profile sample` (a SIGPROF sampler, which barely slows the solver down
+and so doesn't distort cheap, very frequent calls). Allocations are traced
+with tracemalloc in a second call of solve(): tracing makes code that
+creates lots of small objects an order of magnitude slower, which would
+swamp the timings.
+
+The report is a table of the hottest functions followed by the top
+allocation sites, written next to the script as
+<script>.<function>[.<args>].profile.txt, e.g. solution.solve.2.profile.txt
+for day 19's solve(2).
+"""
+import cProfile
+import io
+import pstats
+import signal
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+
+MODES = ("cprofile", "sample")
+TOP = 25
+SAMPLE_INTERVAL = 0.001
+
+
+def frame_name(code):
+    return f"{Path(code.co_filename).name}:{code.co_firstlineno}({code.co_name})"
+
+
+class Sampler:
+    """Count, every `interval` of CPU time, which functions are on the stack"""
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval = interval
+        self.samples = 0
+        self.own = Counter()
+        self.total = Counter()
+        self.busy = False
+
+    def _sample(self, signum, frame):
+        # keyed on code objects, names are only worked out for the report;
+        # a slow handler would be interrupted by the next tick
+        if self.busy:
+            return
+        self.busy = True
+        self.samples += 1
+        self.own[frame.f_code] += 1
+        seen = set()
+        while frame is not None:
+            if frame.f_code not in seen:
+                self.total[frame.f_code] += 1
+                seen.add(frame.f_code)
+            frame = frame.f_back
+        self.busy = False
+
+    def __enter__(self):
+        self.previous = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        return self
+
+    def __exit__(self, *exc):
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self.previous)
+
+    def report(self, top=TOP):
+        lines = [
+            f"{self.samples} samples every {self.interval * 1000:g}ms of CPU",
+            "",
+            f"{'own':>7} {'total':>7}  function",
+        ]
+        # functions that only call others rank after the ones doing the work
+        ranked = sorted(self.total, key=lambda c: (self.own[c], self.total[c]))
+        for code in reversed(ranked[-top:]):
+            count = self.own[code]
+            lines.append(
+                f"{count / self.samples:7.1%} {self.total[code] / self.samples:7.1%}"
+                f"  {frame_name(code)}"
+            )
+        return "\n".join(lines)
+
+
+def cprofile_report(profiler, top=TOP):
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+    return stream.getvalue().strip()
+
+
+def allocation_report(snapshot, top=TOP):
+    snapshot = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ]
+    )
+    stats = snapshot.statistics("lineno")
+    total = sum(stat.size for stat in stats)
+    lines = [f"{total / 1024:.1f} KiB still allocated at the end of solve()", ""]
+    for stat in stats[:top]:
+        frame = stat.traceback[0]
+        lines.append(
+            f"{stat.size / 1024:10.1f} KiB {stat.count:9} blocks  "
+            f"{frame.filename}:{frame.lineno}"
+        )
+    return "\n".join(lines)
+
+
+def peak_report(peak, current):
+    return f"traced memory: peak {peak / 1024:.1f} KiB, end {current / 1024:.1f} KiB"
+
+
+def profile_call(solve, *args, mode="cprofile", output=None, top=TOP, memory=True):
+    """Return solve(*args), writing the time and allocation profile to output"""
+    if mode not in MODES:
+        raise ValueError(f"profile mode {mode!r} is not one of {MODES}")
+
+    start = time.perf_counter()
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        result = profiler.runcall(solve, *args)
+        hot = cprofile_report(profiler, top)
+    else:
+        with Sampler() as profiler:
+            result = solve(*args)
+        hot = profiler.report(top)
+    wall = time.perf_counter() - start
+
+    name = getattr(solve, "__qualname__", solve)
+    sections = [f"{name}: {wall:.3f}s wall under {mode}", "# --> Hot functions", hot]
+
+    if memory:
+        tracemalloc.start()
+        try:
+            # hold on to the answer so what it's built from shows up too
+            kept = solve(*args)  # noqa: F841
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        sections += [
+            "# --> Allocation sites",
+            peak_report(peak, current),
+            allocation_report(snapshot, top),
+        ]
+
+    text = "\n\n".join(sections) + "\n"
+    if output is None:
+        sys.stdout.write(text)
+    else:
+        Path(output).write_text(text)
+    return result
+
+
+# --> Test driven development helpers
+
+
+def busy(n):
+    total = 0
+    for i in range(n):
+        total += i * i
+    return total
+
+
+def build(n):
+    return [str(i) for i in range(n)]
+
+
+def test_cprofile(tmp_path):
+    out = tmp_path / "profile.txt"
+    assert profile_call(busy, 10_000, output=out) == busy(10_000)
+    text = out.read_text()
+    assert "# --> Hot functions" in text and "(busy)" in text
+
+
+def test_allocation_sites(tmp_path):
+    out = tmp_path / "profile.txt"
+    assert len(profile_call(build, 10_000, output=out)) == 10_000
+    assert "profiling.py" in out.read_text().split("# --> Allocation sites")[1]
+
+
+def test_sample(tmp_path):
+    out = tmp_path / "profile.txt"
+    profile_call(busy, 1_000_000, mode="sample", output=out)
+    text = out.read_text()
+    assert "samples every" in text and "(busy)" in text
+
+
+def test_bad_mode():
+    import pytest
+
+    with pytest.raises(ValueError):
+        profile_call(busy, 1, mode="perf")
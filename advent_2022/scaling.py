@@ -0,0 +1,146 @@
+"""Time each day's solvers on generated inputs of growing size
+
+    python -m advent_2022.scaling 01 06 --timeout 60 -o scaling.json
+    python -m advent_2022.scaling 20 --sizes 1e3 1e4 1e5 --plot scaling.png
+
+Inputs come from advent_2022.generate, using each day's default sizes
+unless --sizes is given. A part that times out or fails is not run on the
+larger inputs. The printed exponent k fits wall ~ n**k over the two
+largest sizes a part finished, where n is the amount of input (size, or
+size squared for the grid days); k near 2 or above points at a quadratic
+hot path. --plot draws runtime against size on log-log axes (matplotlib).
+"""
+import argparse
+import json
+import math
+import tempfile
+from itertools import groupby
+from pathlib import Path
+
+from advent_2022.bench import environment, measure
+from advent_2022.generate import GENERATORS, write
+from advent_2022.solvers import discover
+
+SUPERLINEAR = 1.5
+
+
+def scaling_run(solvers, sizes=None, repeat=1, timeout=None, seed=0, workdir=None):
+    """Yield a bench record, plus its input size, per (part, size)"""
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        for day, group in groupby(solvers, key=lambda s: s.day):
+            group = list(group)
+            alive = {solver.name for solver in group}
+            for size in sizes or GENERATORS[day].sizes:
+                if not alive:
+                    break
+                path = write(day, size, Path(tmp) / f"{day}_{size}.txt", seed)
+                for solver in group:
+                    if solver.name not in alive:
+                        continue
+                    record = measure(solver, repeat, timeout, input_path=path)
+                    record["size"] = size
+                    if record["status"] != "ok":
+                        alive.discard(solver.name)
+                    yield record
+                path.unlink()
+
+
+def growth_exponent(points):
+    """k in wall ~ size**k from the two largest (size, wall) points"""
+    points = sorted(points)[-2:]
+    if len(points) < 2:
+        return None
+    (size1, wall1), (size2, wall2) = points
+    if wall1 <= 0 or wall2 <= 0:
+        return None
+    return math.log(wall2 / wall1) / math.log(size2 / size1)
+
+
+def curves(records):
+    """(size, best wall time) points per part that finished"""
+    by_solver = {}
+    for record in records:
+        if record["status"] == "ok":
+            by_solver.setdefault(record["solver"], []).append(
+                (record["size"], min(record["wall"]))
+            )
+    return by_solver
+
+
+def plot(records, path):
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(10, 7))
+    for solver, points in curves(records).items():
+        sizes, walls = zip(*sorted(points))
+        ax.loglog(sizes, walls, marker="o", label=solver)
+    ax.set_xlabel("input size (generator units)")
+    ax.set_ylabel("wall time (s)")
+    ax.grid(True, which="both", alpha=0.3)
+    ax.legend(fontsize="small", ncol=2)
+    fig.savefig(path, bbox_inches="tight")
+    plt.close(fig)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("days", nargs="*", help="only these days, e.g. 01 16")
+    parser.add_argument("--sizes", nargs="+", type=lambda s: int(float(s)))
+    parser.add_argument("-n", "--repeat", type=int, default=1)
+    parser.add_argument("--timeout", type=float, help="seconds allowed per run")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", type=Path, default=Path("scaling.json"))
+    parser.add_argument("--plot", type=Path, help="e.g. scaling.png")
+    args = parser.parse_args(argv)
+
+    days = args.days or sorted(GENERATORS)
+    solvers = [s for s in discover(days=days) if s.day in GENERATORS]
+    records = []
+    for record in scaling_run(
+        solvers, args.sizes, args.repeat, args.timeout, args.seed
+    ):
+        wall = min(record["wall"]) if record["status"] == "ok" else None
+        shown = f"{wall:9.4f}s" if wall is not None else record["status"]
+        print(f"{record['solver']:<32} {record['size']:>12,} {shown}", flush=True)
+        records.append(record)
+
+    print()
+    days_of = {record["solver"]: record["day"] for record in records}
+    for solver, points in curves(records).items():
+        k = growth_exponent(points)
+        if k is not None:
+            k /= GENERATORS[days_of[solver]].dims
+            flag = "  <-- superlinear" if k > SUPERLINEAR else ""
+            print(f"{solver:<32} k = {k:5.2f}{flag}")
+
+    report = {**environment(), "results": records}
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    if args.plot:
+        plot(records, args.plot)
+
+
+# --> Test driven development helpers
+
+
+def test_growth_exponent():
+    assert growth_exponent([(10, 1.0), (100, 10.0)]) == 1.0
+    assert round(growth_exponent([(1, 5.0), (10, 1.0), (100, 100.0)]), 6) == 2.0
+    assert growth_exponent([(10, 1.0)]) is None
+
+
+def test_scaling_run_drops_failed_parts(tmp_path):
+    from advent_2022.solvers import DAYS, Solver
+
+    solvers = [Solver(DAYS / "01" / "part1.py", "solve")]
+    records = list(scaling_run(solvers, sizes=[100, 1000], workdir=tmp_path))
+    assert [(r["size"], r["status"]) for r in records] == [(100, "ok"), (1000, "ok")]
+
+    records = list(scaling_run(solvers, sizes=[100, 1000], timeout=1e-5))
+    assert [r["status"] for r in records] == ["timeout"]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Find every solve() under days/ and load it without running the scripts"""
+import ast
+import importlib.util
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+ROOT = Path(__file__).resolve().parent.parent
+DAYS = ROOT / "days"
+
+SOLVE_NAMES = ("solve", "solve1", "solve2")
+
+# Solvers that take more than the puzzle input, copied from the
+# __main__ blocks. Each tuple of arguments is benchmarked as its own part.
+SOLVE_ARGS = {
+    "11/part2.py:solve": [(10_000,)],
+    "15/part1.py:solve": [(2_000_000,)],
+    "15/part2.py:solve": [((0, 4_000_000),)],
+    "19/solution.py:solve": [(1,), (2,)],
+    "24/day_24.py:solve": [(1,), (2,)],
+}
+
+
+class Solver(NamedTuple):
+    """One solve() call: which module, which function, which extra args"""
+
+    path: Path
+    function: str
+    args: tuple = ()
+
+    @property
+    def day(self):
+        return self.path.parent.name
+
+    @property
+    def key(self):
+        return f"{self.day}/{self.path.name}:{self.function}"
+
+    @property
+    def name(self):
+        if not self.args:
+            return self.key
+        return f"{self.key}{self.args!r}"
+
+    @property
+    def input_path(self):
+        return self.path.parent / "input.txt"
+
+    def load(self):
+        module = load_module(self.path)
+        return getattr(module, self.function)
+
+    def __call__(self, input_data):
+        return self.load()(input_data, *self.args)
+
+
+def defined_solvers(path):
+    """Names of the top-level solve functions a module defines itself.
+
+    Parsing instead of importing keeps discovery cheap, and modules that
+    only re-export a solver (day 19's `from solution import *`) are not
+    counted twice.
+    """
+    tree = ast.parse(path.read_text(), filename=str(path))
+    return [
+        node.name
+        for node in tree.body
+        if isinstance(node, ast.FunctionDef) and node.name in SOLVE_NAMES
+    ]
+
+
+def discover(days_dir=DAYS, days=None):
+    """Yield a Solver for every solve() call in days_dir, in day order"""
+    for path in sorted(days_dir.glob("[0-9][0-9]/*.py")):
+        if days and path.parent.name not in days:
+            continue
+        for function in defined_solvers(path):
+            solver = Solver(path, function)
+            for args in SOLVE_ARGS.get(solver.key, [()]):
+                yield solver._replace(args=args)
+
+
+def load_module(path):
+    """Import a day's script under a unique name.
+
+    Every day has a part1.py, so the module name carries the day number.
+    The day's directory goes on sys.path for sibling imports like day 19's
+    `solution`.
+    """
+    path = Path(path).resolve()
+    name = f"day{path.parent.name}_{path.stem}"
+    if name in sys.modules:
+        return sys.modules[name]
+
+    day_dir = str(path.parent)
+    if day_dir not in sys.path:
+        sys.path.insert(0, day_dir)
+
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def reference_answers(script, size, seed=0, parts=("part1.py", "part2.py")):
+    """A generated input for script's day, and what the day's own part
+    scripts answer for it: what a faster solver in script has to match"""
+    from advent_2022.generate import generate
+
+    script = Path(script)
+    text = generate(script.parent.name, size, seed=seed)
+    return text, tuple(load_module(script.with_name(p)).solve(text) for p in parts)
+
+
+# --> Test driven development helpers
+
+
+def test_discover_oddballs():
+    keys = {solver.key for solver in discover()}
+    assert "01/part1.py:solve" in keys
+    assert "12/wip.py:solve1" in keys
+    assert "12/wip.py:solve2" in keys
+    assert "19/solution.py:solve" in keys
+    assert "24/day_24.py:solve" in keys
+
+    # part1/part2 of day 19 only re-export solution.solve
+    assert "19/part1.py:solve" not in keys
+
+
+def test_discover_extra_args():
+    names = [solver.name for solver in discover(days=["24"])]
+    assert names == ["24/day_24.py:solve(1,)", "24/day_24.py:solve(2,)"]
+
+
+def test_load():
+    solver = Solver(DAYS / "01" / "part1.py", "solve")
+    assert solver("1\n2\n\n4") == 4
+
+
+def test_reference_answers():
+    text, (part1,) = reference_answers(DAYS / "01" / "x.py", 10, parts=("part1.py",))
+    assert part1 == Solver(DAYS / "01" / "part1.py", "solve")(text)
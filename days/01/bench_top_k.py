@@ -0,0 +1,61 @@
+"""Sort every elf's total vs keep a heap of the top k vs numpy, on a big input
+
+    python bench_top_k.py                  # 10^8 lines of calories
+    python bench_top_k.py --lines 1e6 -k 10
+
+The input is generated once (advent_2022.generate) and streamed from a
+memory map, so the parse itself stays in constant memory and the
+difference in peak RSS is the list of totals that sorting has to build.
+Both peaks include the pages of the mapped file that have been read, which
+the kernel can drop whenever it needs the memory.
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from advent_2022.bench import peak_rss_kb, reset_peak_rss
+from advent_2022.generate import write
+from advent_2022.loader import MappedInput
+from advent_2022.solvers import load_module
+
+part2 = load_module(Path(__file__).with_name("part2.py"))
+calories_numpy = load_module(Path(__file__).with_name("calories_numpy.py"))
+
+
+def by_sorting(totals, k):
+    return sorted(totals)[-k:][::-1]
+
+
+def run(name, reduce, path, k):
+    reset_peak_rss()
+    start = time.perf_counter()
+    if reduce is None:
+        top = calories_numpy.top_k_file(path, k)
+    else:
+        with MappedInput(path) as mapped:
+            top = reduce(part2.parser(mapped), k)
+    wall = time.perf_counter() - start
+    print(f"{name:<8} {wall:8.2f}s  peak {peak_rss_kb() / 1024:8.1f}MB  {sum(top)}")
+    return top
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=lambda s: int(float(s)), default=10**8)
+    parser.add_argument("-k", type=int, default=3)
+    parser.add_argument("--input", type=Path, help="reuse this calorie file")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.input
+        if path is None:
+            path = write("01", args.lines, Path(tmp) / "calories.txt")
+        heap = run("heap", part2.top_k, path, args.k)
+        ordered = run("sort", by_sorting, path, args.k)
+        vectorized = run("numpy", None, path, args.k)
+        assert heap == ordered == vectorized
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import mmap
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from heapq import nlargest
+from os import PathLike
+
+import numpy as np
+
+from advent_2022.harness import open_input, run_solver, run_tests
+from advent_2022.loader import as_bytes, byte_array, numbers_before
+
+# --> Puzzle solution
+
+NEWLINE = ord("\n")
+
+# per chunk, the numpy temporaries take a few times the chunk's size
+CHUNK_SIZE = 32 * 1024 * 1024
+
+
+def group_totals(raw):
+    """Calories per elf in a bytes-like run of whole elves.
+
+    Blank lines are the zero-length ones; np.add.reduceat sums the line
+    values between them.
+    """
+    data = byte_array(raw)
+    ends = np.flatnonzero(data == NEWLINE)
+    if not ends.size:
+        return np.zeros(0, dtype=np.int64)
+
+    values, lengths = numbers_before(data, ends)
+    starts = np.concatenate(([0], np.flatnonzero(lengths == 0) + 1))
+    starts = starts[starts < values.size]
+    return np.add.reduceat(values, starts)
+
+
+def top_k(totals, k):
+    if totals.size > k:
+        totals = np.partition(totals, -k)[-k:]
+    return sorted(totals.tolist(), reverse=True)
+
+
+def chunk_bounds(data, chunk_size=CHUNK_SIZE):
+    """(start, stop) offsets about chunk_size apart, cut just after a blank
+    line so no elf is split between chunks"""
+    start, size = 0, len(data)
+    while start < size:
+        stop = data.find(b"\n\n", start + chunk_size)
+        stop = size if stop < 0 else stop + 2
+        yield start, stop
+        start = stop
+
+
+def chunk_top_k(path, start, stop, k):
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        view = memoryview(m)[start:stop]
+        try:
+            return top_k(group_totals(view), k)
+        finally:
+            view.release()
+
+
+def top_k_file(path, k, chunk_size=CHUNK_SIZE, jobs=None):
+    """Top k elves of a calorie file of any size.
+
+    Each chunk is mapped and reduced to its own top k in a worker process;
+    the overall top k is among those.
+    """
+    with open(path, "rb") as f:
+        if not f.seek(0, 2):
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            bounds = list(chunk_bounds(m, chunk_size))
+    if len(bounds) == 1:
+        return chunk_top_k(path, *bounds[0], k)
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(chunk_top_k, path, *b, k) for b in bounds]
+        return nlargest(k, (total for f in futures for total in f.result()))
+
+
+def top_k_input(input_data, k):
+    if isinstance(input_data, PathLike):
+        return top_k_file(input_data, k)
+    return top_k(group_totals(as_bytes(input_data)), k)
+
+
+def solve1(input_data):
+    return sum(top_k_input(input_data, 1))
+
+
+def solve2(input_data):
+    return sum(top_k_input(input_data, 3))
+
+
+# --> Test driven development helpers
+
+if "pytest" in sys.modules:
+    import pytest
+
+    EXAMPLE = """1000
+2000
+3000
+
+4000
+
+5000
+6000
+
+7000
+8000
+9000
+
+10000"""
+
+    @pytest.mark.parametrize(
+        "solve,sample_solution", [(solve1, 24000), (solve2, 45000)]
+    )
+    def test_samples(solve, sample_solution) -> None:
+        assert solve(EXAMPLE) == sample_solution
+        assert solve(EXAMPLE + "\n") == sample_solution
+
+    def test_group_totals() -> None:
+        assert group_totals(b"1\n\n22\n333\n").tolist() == [1, 355]
+        assert group_totals(b"").tolist() == []
+
+    def test_chunked_file_matches(tmp_path) -> None:
+        from advent_2022.generate import generate
+
+        text = generate("01", 20_000, seed=5)
+        path = tmp_path / "input.txt"
+        path.write_text(text)
+
+        expected = top_k(group_totals(text.encode()), 5)
+        assert top_k_file(path, 5, chunk_size=10_000, jobs=2) == expected
+        assert top_k_file(path, 5) == expected
+
+
+# --> Setup and run
+
+if __name__ == "__main__":
+    run_tests(__file__)
+    with open_input() as my_input:
+        result = run_solver(solve1, my_input)
+        print("Part 1:", result)
+        result = run_solver(solve2, my_input)
+        print("Part 2:", result)
@@ -1,8 +1,8 @@
 import sys
-from pathlib import Path
+from heapq import nlargest
 
-import pytest
-from icecream import ic
+from advent_2022.harness import main
+from advent_2022.loader import lines
 
 
 # --> Puzzle solution
@@ -10,7 +10,7 @@ from icecream import ic
 
 def parser(data):
     current = 0
-    for line in data.splitlines():
+    for line in lines(data):
         if not line:
             yield current
             current = 0
@@ -20,27 +20,37 @@ def parser(data):
         yield current
 
 
-def solve(input_data):
-    data = sorted(parser(input_data))
-    return sum(data[-3:])
+def top_k(totals, k):
+    """The k largest totals, largest first.
 
+    nlargest keeps a heap of only k items as it consumes the generator, so
+    this is O(n log k) time and O(k) memory instead of a sort of every elf.
+    """
+    return nlargest(k, totals)
 
-# --> Test driven development helpers
 
-# keep pytest ids smaller
-def idfn(maybe_string):
-    if isinstance(maybe_string, str):
-        # chop off long input strings in test name output
-        return maybe_string[:5].strip()
-    return str(maybe_string)
+def solve(input_data, k=3):
+    return sum(top_k(parser(input_data), k))
+
 
+# --> Test driven development helpers
 
-# Test any examples given in the problem
-@pytest.mark.parametrize(
-    "sample_data,sample_solution",
-    [
-        (
-            """1000
+if "pytest" in sys.modules:
+    import pytest
+
+    # keep pytest ids smaller
+    def idfn(maybe_string):
+        if isinstance(maybe_string, str):
+            # chop off long input strings in test name output
+            return maybe_string[:5].strip()
+        return str(maybe_string)
+
+    # Test any examples given in the problem
+    @pytest.mark.parametrize(
+        "sample_data,sample_solution",
+        [
+            (
+                """1000
 2000
 3000
 
@@ -54,39 +64,22 @@ def idfn(maybe_string):
 9000
 
 10000""",
-            45000,
-        )
-    ],
-    ids=idfn,
-)
-def test_samples(sample_data, sample_solution) -> None:
-    assert solve(sample_data) == sample_solution
+                45000,
+            )
+        ],
+        ids=idfn,
+    )
+    def test_samples(sample_data, sample_solution) -> None:
+        assert solve(sample_data) == sample_solution
+
+    def test_top_k():
+        totals = [6000, 4000, 11000, 24000, 10000]
+        assert top_k(iter(totals), 1) == [24000]
+        assert top_k(iter(totals), 3) == [24000, 11000, 10000]
+        assert top_k(iter(totals), 10) == sorted(totals, reverse=True)
 
 
 # --> Setup and run
 
 if __name__ == "__main__":
-
-    # set up a debug log to hold icecream output
-    with Path("debug.log").open("w") as debug_log:
-
-        def debug_logger(stuff):
-            debug_log.write(stuff)
-            debug_log.write("\n")
-
-        ic.configureOutput(outputFunction=debug_logger)
-
-        #  Run the test examples with icecream debug-trace turned on
-        ic.enable()
-        ex = pytest.main([__file__])
-        if ex != pytest.ExitCode.OK and ex != pytest.ExitCode.NO_TESTS_COLLECTED:
-            print(f"tests FAILED ({ex})")
-            sys.exit(1)
-        else:
-            print("tests PASSED")
-
-        #  Actual input data generally has more iterations, turn off log
-        ic.disable()
-        my_input = Path("input.txt").read_text()
-        result = solve(my_input)
-        print(result)
+    main(__file__, solve, pytest_args=[], debug_log="debug.log")
@@ -1,8 +1,7 @@
 import sys
-from pathlib import Path
 
-import pytest
-from icecream import ic
+from advent_2022.harness import main
+from advent_2022.loader import lines
 
 # --> Puzzle solution
 
@@ -30,7 +29,7 @@ my_move = {
 
 def solve(input_data):
     score = 0
-    for line in input_data.splitlines():
+    for line in lines(input_data):
         opp, me = line.split()
         my_obj = my_move[(opponent_key[opp], self_outcome[me])]
         score += object_scores[my_obj]
@@ -40,46 +39,34 @@ def solve(input_data):
 
 # --> Test driven development helpers
 
-# keep pytest ids smaller
-def idfn(maybe_string):
-    if isinstance(maybe_string, str):
-        # chop off long input strings in test name output
-        return maybe_string[:5].strip()
-    return str(maybe_string)
-
-
-# Test any examples given in the problem
-@pytest.mark.parametrize(
-    "sample_data,sample_solution",
-    [
-        (
-            """A Y
+if "pytest" in sys.modules:
+    import pytest
+
+    # keep pytest ids smaller
+    def idfn(maybe_string):
+        if isinstance(maybe_string, str):
+            # chop off long input strings in test name output
+            return maybe_string[:5].strip()
+        return str(maybe_string)
+
+    # Test any examples given in the problem
+    @pytest.mark.parametrize(
+        "sample_data,sample_solution",
+        [
+            (
+                """A Y
 B X
 C Z""",
-            12,
-        )
-    ],
-    ids=idfn,
-)
-def test_samples(sample_data, sample_solution) -> None:
-    assert solve(sample_data) == sample_solution
+                12,
+            )
+        ],
+        ids=idfn,
+    )
+    def test_samples(sample_data, sample_solution) -> None:
+        assert solve(sample_data) == sample_solution
 
 
 # --> Setup and run
 
 if __name__ == "__main__":
-
-    #  Run the test examples with icecream debug-trace turned on
-    ic.enable()
-    ex = pytest.main([__file__, "--capture=tee-sys", "-v"])
-    if ex != pytest.ExitCode.OK and ex != pytest.ExitCode.NO_TESTS_COLLECTED:
-        print(f"tests FAILED ({ex})")
-        sys.exit(1)
-    else:
-        print("tests PASSED")
-
-    #  Actual input data generally has more iterations, turn off log
-    ic.disable()
-    my_input = Path("input.txt").read_text()
-    result = solve(my_input)
-    print(result)
+    main(__file__, solve)
@@ -0,0 +1,126 @@
+import sys
+
+import numpy as np
+
+from advent_2022.harness import open_input, run_solver, run_tests
+from advent_2022.loader import as_bytes
+
+# --> Puzzle solution
+
+# Every round is "A X\n": opponent at byte 0 and second column at byte 2 of
+# each 4 byte stride. Numbering the opponent's shape and the second column
+# 0..2 makes each round an index 3 * opponent + column into a 9 entry table
+# of scores, one table per reading of the second column.
+ROUND = 4
+NEWLINE = ord("\n")
+RULES = ("shape", "outcome")
+
+
+def score_table(rule):
+    table = np.zeros(9, dtype=np.int64)
+    for opponent in range(3):
+        for column in range(3):
+            if rule == "shape":
+                # part 1: X, Y, Z is what I play
+                mine = column
+            else:
+                # part 2: X, Y, Z is lose, draw, win
+                mine = (opponent + column - 1) % 3
+            # 0 lost, 1 draw, 2 won: the next shape round beats this one
+            outcome = (mine - opponent + 1) % 3
+            table[3 * opponent + column] = mine + 1 + 3 * outcome
+    return table
+
+
+TABLES = {rule: score_table(rule) for rule in RULES}
+
+
+def round_counts(input_data):
+    """How many times each of the 9 rounds is played"""
+    data = np.frombuffer(as_bytes(input_data), dtype=np.uint8)
+    # the last round may have no newline
+    n_rounds = (data.size + 1) // ROUND
+    opponents = data[0::ROUND][:n_rounds] - np.uint8(ord("A"))
+    columns = data[2::ROUND][:n_rounds] - np.uint8(ord("X"))
+    # checked before indexing: bytes below "A" or "X" wrap round in uint8
+    if (
+        # every round whole, only the last one may lack its newline
+        data.size not in (n_rounds * ROUND - 1, n_rounds * ROUND)
+        or np.any(opponents > 2)
+        or np.any(columns > 2)
+        or np.any(data[1::ROUND] != ord(" "))
+        or np.any(data[3::ROUND] != NEWLINE)
+    ):
+        raise ValueError("input is not one 'A X' round per line")
+    return np.bincount(opponents * np.uint8(3) + columns, minlength=9)
+
+
+def score(input_data, rule):
+    """Total score under one rule set; counting the rounds first turns the
+    per-round table lookup into one 9 element dot product"""
+    return int(round_counts(input_data) @ TABLES[rule])
+
+
+def solve1(input_data):
+    return score(input_data, "shape")
+
+
+def solve2(input_data):
+    return score(input_data, "outcome")
+
+
+# --> Test driven development helpers
+
+if "pytest" in sys.modules:
+    import pytest
+
+    EXAMPLE = """A Y
+B X
+C Z"""
+
+    @pytest.mark.parametrize("solve,sample_solution", [(solve1, 15), (solve2, 12)])
+    def test_samples(solve, sample_solution) -> None:
+        assert solve(EXAMPLE) == sample_solution
+        assert solve(EXAMPLE + "\n") == sample_solution
+
+    def test_tables() -> None:
+        # A X, A Y, A Z, B X, ... worked out by hand from the puzzle text
+        assert TABLES["shape"].tolist() == [4, 8, 3, 1, 5, 9, 7, 2, 6]
+        assert TABLES["outcome"].tolist() == [3, 4, 8, 1, 5, 9, 2, 6, 7]
+
+    def test_rejects_other_layouts() -> None:
+        with pytest.raises(ValueError):
+            solve1("A  Y\nB X")
+        with pytest.raises(ValueError):
+            solve1("D X")
+        out_of_range = ["A [", "@ X", "A W"]
+        truncated = ["A Y\nB", "A Y\nB X\nC"]
+        blank_lines = ["A Y\n\nB X", "A Y\nB X\n\n"]
+        for text in out_of_range + truncated + blank_lines:
+            with pytest.raises(ValueError):
+                solve1(text)
+
+    def test_matches_line_solvers() -> None:
+        from advent_2022.solvers import reference_answers
+
+        text, expected = reference_answers(__file__, 5_000, seed=2)
+        assert (solve1(text), solve2(text)) == expected
+
+    def test_mapped_file(tmp_path) -> None:
+        from advent_2022.loader import MappedInput
+
+        path = tmp_path / "input.txt"
+        path.write_text(EXAMPLE)
+        assert solve1(MappedInput(path)) == 15
+        assert solve1("") == 0
+
+
+# --> Setup and run
+
+if __name__ == "__main__":
+    run_tests(__file__)
+    with open_input() as my_input:
+        result = run_solver(solve1, my_input)
+        print("Part 1:", result)
+        result = run_solver(solve2, my_input)
+        print("Part 2:", result)
@@ -1,18 +1,15 @@
 import sys
-from pathlib import Path
 
-import pytest
-from icecream import ic
+from advent_2022.harness import main
+from advent_2022.loader import lines
 
 
 # --> Puzzle solution
 
 
 def parse(input_data):
-    data = input_data.splitlines()
-    while data:
-        yield data[:3]
-        data = data[3:]
+    # three lines at a time, straight off the stream
+    return zip(*[lines(input_data)] * 3)
 
 
 scores = dict(zip("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ", range(1, 53)))
@@ -33,56 +30,43 @@ def solve(input_data):
 
 # --> Test driven development helpers
 
-# keep pytest ids smaller
-def idfn(maybe_string):
-    if isinstance(maybe_string, str):
-        # chop off long input strings in test name output
-        return maybe_string[:5].strip()
-    return str(maybe_string)
-
-
-def test_scores():
-    assert scores["p"] == 16
-    assert scores["L"] == 38
-    assert scores["P"] == 42
-    assert scores["v"] == 22
-
-
-# Test any examples given in the problem
-@pytest.mark.parametrize(
-    "sample_data,sample_solution",
-    [
-        (
-            """vJrwpWtwJgWrhcsFMMfFFhFp
+if "pytest" in sys.modules:
+    import pytest
+
+    # keep pytest ids smaller
+    def idfn(maybe_string):
+        if isinstance(maybe_string, str):
+            # chop off long input strings in test name output
+            return maybe_string[:5].strip()
+        return str(maybe_string)
+
+    def test_scores():
+        assert scores["p"] == 16
+        assert scores["L"] == 38
+        assert scores["P"] == 42
+        assert scores["v"] == 22
+
+    # Test any examples given in the problem
+    @pytest.mark.parametrize(
+        "sample_data,sample_solution",
+        [
+            (
+                """vJrwpWtwJgWrhcsFMMfFFhFp
 jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL
 PmmdzqPrVvPwwTWBwg
 wMqvLMZHhHMvwLHjbvcjnnSBnvTQFn
 ttgJtRGJQctTZtZT
 CrZsJsPPZsGzwwsLwLmpwMDw""",
-            70,
-        )
-    ],
-    ids=idfn,
-)
-def test_samples(sample_data, sample_solution) -> None:
-    assert solve(sample_data) == sample_solution
+                70,
+            )
+        ],
+        ids=idfn,
+    )
+    def test_samples(sample_data, sample_solution) -> None:
+        assert solve(sample_data) == sample_solution
 
 
 # --> Setup and run
 
 if __name__ == "__main__":
-
-    #  Run the test examples with icecream debug-trace turned on
-    ic.enable()
-    ex = pytest.main([__file__, "--capture=tee-sys", "-v"])
-    if ex != pytest.ExitCode.OK and ex != pytest.ExitCode.NO_TESTS_COLLECTED:
-        print(f"tests FAILED ({ex})")
-        sys.exit(1)
-    else:
-        print("tests PASSED")
-
-    #  Actual input data generally has more iterations, turn off log
-    ic.disable()
-    my_input = Path("input.txt").read_text()
-    result = solve(my_input)
-    print(result)
+    main(__file__, solve)
@@ -0,0 +1,123 @@
+import sys
+
+import numpy as np
+
+from advent_2022.harness import open_input, run_solver, run_tests
+from advent_2022.loader import byte_array, lines
+
+# --> Puzzle solution
+
+# A set of items is a 52 bit mask with priority p at bit p - 1, so sets
+# intersect with & and a one item set's priority is its bit_length().
+ITEMS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+BITS = {item: 1 << bit for bit, item in enumerate(ITEMS)}
+
+# the same per byte, for whole files at once; anything else (newlines) is 0
+BYTE_BITS = np.zeros(256, dtype=np.uint64)
+BYTE_BITS[np.frombuffer(ITEMS.encode(), dtype=np.uint8)] = [
+    BITS[item] for item in ITEMS
+]
+NEWLINE = ord("\n")
+
+
+def item_mask(items):
+    # distinct bits, so summing them is the same as OR-ing them
+    return sum(map(BITS.__getitem__, set(items)))
+
+
+def priority(mask):
+    return mask.bit_length()
+
+
+def compartments(input_data):
+    for line in lines(input_data):
+        size = len(line) // 2
+        yield item_mask(line[:size]), item_mask(line[size:])
+
+
+def groups(input_data, size=3):
+    masks = map(item_mask, lines(input_data))
+    return zip(*[masks] * size)
+
+
+# --> Numpy batch: one uint64 mask per rucksack or compartment
+
+
+def batch_masks(input_data, halves=False):
+    """Every rucksack's mask, or with halves=True an (n, 2) array of its
+    compartments' masks.
+
+    Each byte becomes its item's bit and np.bitwise_or.reduceat ORs the
+    bits between line starts (and midpoints); a newline contributes 0 to
+    the line before it.
+    """
+    data = byte_array(input_data)
+    ends = np.flatnonzero(data == NEWLINE)
+    if not ends.size:
+        return np.zeros((0, 2) if halves else 0, dtype=np.uint64)
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    if halves:
+        starts = np.stack((starts, starts + (ends - starts) // 2), axis=1).ravel()
+    masks = np.bitwise_or.reduceat(BYTE_BITS[data], starts)
+    return masks.reshape(-1, 2) if halves else masks
+
+
+def batch_priorities(masks):
+    """Priority of each one-bit mask: frexp(2**k) has exponent k + 1"""
+    return np.frexp(masks.astype(np.float64))[1]
+
+
+def solve1(input_data):
+    halves = batch_masks(input_data, halves=True)
+    return int(batch_priorities(halves[:, 0] & halves[:, 1]).sum())
+
+
+def solve2(input_data):
+    masks = batch_masks(input_data).reshape(-1, 3)
+    return int(batch_priorities(np.bitwise_and.reduce(masks, axis=1)).sum())
+
+
+# --> Test driven development helpers
+
+if "pytest" in sys.modules:
+    import pytest
+
+    EXAMPLE = """vJrwpWtwJgWrhcsFMMfFFhFp
+jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL
+PmmdzqPrVvPwwTWBwg
+wMqvLMZHhHMvwLHjbvcjnnSBnvTQFn
+ttgJtRGJQctTZtZT
+CrZsJsPPZsGzwwsLwLmpwMDw"""
+
+    def test_priority():
+        assert priority(item_mask("p")) == 16
+        assert priority(item_mask("L")) == 38
+        assert priority(item_mask("vJrwpWtwJgWrhcsFMMfFFhFp") & item_mask("P")) == 0
+        masks = BYTE_BITS[np.frombuffer(b"aZ", dtype=np.uint8)]
+        assert batch_priorities(masks).tolist() == [1, 52]
+
+    def test_scalar_path():
+        assert sum(priority(a & b) for a, b in compartments(EXAMPLE)) == 157
+        assert sum(priority(a & b & c) for a, b, c in groups(EXAMPLE)) == 70
+
+    @pytest.mark.parametrize("solve,sample_solution", [(solve1, 157), (solve2, 70)])
+    def test_samples(solve, sample_solution) -> None:
+        assert solve(EXAMPLE) == sample_solution
+        assert solve(EXAMPLE + "\n") == sample_solution
+
+    def test_matches_set_solvers() -> None:
+        from advent_2022.solvers import reference_answers
+
+        text, expected = reference_answers(__file__, 3_000, seed=3)
+        assert (solve1(text), solve2(text)) == expected
+
+
+# --> Setup and run
+
+if __name__ == "__main__":
+    run_tests(__file__)
+    with open_input() as my_input:
+        result = run_solver(solve1, my_input)
+        print("Part 1:", result)
+        result = run_solver(solve2, my_input)
+        print("Part 2:", result)
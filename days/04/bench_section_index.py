@@ -0,0 +1,72 @@
+"""Interval tree queries vs a linear scan with overlap(), on many pairs
+
+    python bench_section_index.py                      # 10^6 pairs
+    python bench_section_index.py --pairs 1e5 --queries 1000 --width 50
+
+Pairs come from advent_2022.generate's day 4 generator, spread over
+--sections sections with ranges at most --width long, so a query matches
+a small fraction of them.
+"""
+import argparse
+import random
+import time
+from pathlib import Path
+
+from advent_2022.generate import section_pairs
+from advent_2022.solvers import load_module
+
+part2 = load_module(Path(__file__).with_name("part2.py"))
+section_index = load_module(Path(__file__).with_name("section_index.py"))
+
+
+def linear(pairs, lo, hi):
+    query = [lo, hi]
+    return [
+        pair
+        for pair, (bounds1, bounds2) in enumerate(pairs)
+        if part2.overlap(bounds1, query) or part2.overlap(bounds2, query)
+    ]
+
+
+def timed(name, queries, answer):
+    start = time.perf_counter()
+    results = [answer(lo, hi) for lo, hi in queries]
+    wall = time.perf_counter() - start
+    matches = sum(map(len, results))
+    print(f"{name:<7} {wall / len(queries) * 1e3:10.3f}ms/query  {matches} matches")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pairs", type=lambda s: int(float(s)), default=10**6)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--sections", type=lambda s: int(float(s)), default=10**7)
+    parser.add_argument("--width", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    text = "".join(section_pairs(args.pairs, rng, args.sections, args.width))
+    pairs = list(part2.parse(text))
+
+    start = time.perf_counter()
+    index = section_index.SectionIndex(pairs)
+    print(f"build   {time.perf_counter() - start:10.3f}s")
+
+    queries = []
+    for _ in range(args.queries):
+        lo = rng.randint(1, args.sections)
+        queries.append((lo, lo + rng.choice([0, args.width])))
+    tree = timed("index", queries, index.overlapping)
+    # the scan is slow enough that a tenth of the queries will do
+    scan = timed(
+        "linear",
+        queries[: max(1, len(queries) // 10)],
+        lambda lo, hi: linear(pairs, lo, hi),
+    )
+    assert tree[: len(scan)] == scan
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Which elf pairs cover a section, or overlap a range of sections
+
+    index = SectionIndex(parse(input_data))   # from part1.py or part2.py
+    index.covering(5123)        # pairs with an elf assigned section 5123
+    index.overlapping(100, 200) # pairs with an elf assigned any of 100-200
+
+Pairs are numbered by their line in the input, from 0. Both queries take
+O(log n + k) for k matching assignments, from a centered interval tree
+over every elf's range plus the ranges' sorted starts.
+"""
+import sys
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+
+# --> Puzzle solution
+
+START = itemgetter(0)
+END = itemgetter(1)
+
+
+class Node:
+    """The ranges that contain center, sorted by start and by end"""
+
+    __slots__ = ["center", "by_start", "by_end", "left", "right"]
+
+    def __init__(self, center, by_start, left, right):
+        self.center = center
+        self.by_start = by_start
+        self.by_end = sorted(by_start, key=END, reverse=True)
+        self.left = left
+        self.right = right
+
+
+def build(ranges):
+    """Interval tree of (start, end, pair) ranges sorted by start.
+
+    Centering each node on the median start leaves at most half the ranges
+    to either side, so the tree is O(log n) deep, and splitting a sorted
+    list keeps every part sorted.
+    """
+    if not ranges:
+        return None
+    center = ranges[len(ranges) // 2][0]
+    left, here, right = [], [], []
+    for r in ranges:
+        if r[1] < center:
+            left.append(r)
+        elif r[0] > center:
+            right.append(r)
+        else:
+            here.append(r)
+    return Node(center, here, build(left), build(right))
+
+
+class SectionIndex:
+    def __init__(self, pairs):
+        ranges = [
+            (start, end, pair)
+            for pair, bounds in enumerate(pairs)
+            for start, end in bounds
+        ]
+        ranges.sort(key=START)
+        self.root = build(ranges)
+        self.starts = [r[0] for r in ranges]
+        self.pairs_by_start = [r[2] for r in ranges]
+
+    def stab(self, section):
+        """The pair of every range containing section"""
+        node = self.root
+        while node is not None:
+            if section < node.center:
+                for start, _, pair in node.by_start:
+                    if start > section:
+                        break
+                    yield pair
+                node = node.left
+            elif section > node.center:
+                for _, end, pair in node.by_end:
+                    if end < section:
+                        break
+                    yield pair
+                node = node.right
+            else:
+                yield from (pair for _, _, pair in node.by_start)
+                return
+
+    def covering(self, section):
+        return sorted(set(self.stab(section)))
+
+    def overlapping(self, lo, hi):
+        """A range overlaps lo-hi if it contains lo or starts in lo+1-hi"""
+        pairs = set(self.stab(lo))
+        first = bisect_right(self.starts, lo)
+        last = bisect_right(self.starts, hi)
+        pairs.update(self.pairs_by_start[first:last])
+        return sorted(pairs)
+
+    def count_starting(self, lo, hi):
+        """How many ranges start in lo-hi, in O(log n)"""
+        return bisect_right(self.starts, hi) - bisect_left(self.starts, lo)
+
+
+# --> Test driven development helpers
+
+if "pytest" in sys.modules:
+    import random
+
+    EXAMPLE = """2-4,6-8
+2-3,4-5
+5-7,7-9
+2-8,3-7
+6-6,4-6
+2-6,4-8"""
+
+    def example_pairs():
+        from pathlib import Path
+
+        from advent_2022.solvers import load_module
+
+        return list(load_module(Path(__file__).with_name("part2.py")).parse(EXAMPLE))
+
+    def test_example_queries():
+        index = SectionIndex(example_pairs())
+        assert index.covering(1) == []
+        assert index.covering(4) == [0, 1, 3, 4, 5]
+        assert index.covering(9) == [2]
+        assert index.overlapping(8, 20) == [0, 2, 3, 5]
+        assert index.overlapping(1, 1) == []
+        assert index.count_starting(2, 2) == 4
+
+    def test_matches_linear_scan():
+        from advent_2022.generate import section_pairs
+
+        rng = random.Random(15)
+        text = "".join(section_pairs(2_000, rng, top=5_000, width=200))
+        pairs = [
+            [[int(n) for n in elf.split("-")] for elf in line.split(",")]
+            for line in text.splitlines()
+        ]
+        index = SectionIndex(pairs)
+        for _ in range(200):
+            lo = rng.randint(-10, 5_010)
+            hi = lo + rng.choice([0, 1, 50, 700])
+            assert index.overlapping(lo, hi) == [
+                pair
+                for pair, bounds in enumerate(pairs)
+                if any(start <= hi and lo <= end for start, end in bounds)
+            ]
+            assert index.covering(lo) == index.overlapping(lo, lo)
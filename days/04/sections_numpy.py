@@ -0,0 +1,83 @@
+import sys
+
+import numpy as np
+
+from advent_2022.harness import open_input, run_solver, run_tests
+from advent_2022.loader import byte_array, numbers_before
+
+# --> Puzzle solution
+
+ZERO = ord("0")
+
+
+def parse_array(input_data):
+    """All the section bounds as an (n, 4) array, one row per line.
+
+    "-", "," and the newline all end a number, so every number is the run
+    of digits before one of them.
+    """
+    data = byte_array(input_data)
+    ends = np.flatnonzero((data < ZERO) | (data > ZERO + 9))
+    values, lengths = numbers_before(data, ends)
+    if ends.size % 4 or np.any(lengths == 0):
+        raise ValueError("input is not one 'a-b,c-d' pair per line")
+    return values.reshape(-1, 4)
+
+
+def counts(pairs):
+    """(pairs where one range contains the other, pairs that overlap)"""
+    lo1, hi1, lo2, hi2 = pairs.T
+    contained = ((lo1 >= lo2) & (hi1 <= hi2)) | ((lo2 >= lo1) & (hi2 <= hi1))
+    overlapping = (lo1 <= hi2) & (lo2 <= hi1)
+    return int(contained.sum()), int(overlapping.sum())
+
+
+def solve(input_data):
+    return counts(parse_array(input_data))
+
+
+def solve1(input_data):
+    return solve(input_data)[0]
+
+
+def solve2(input_data):
+    return solve(input_data)[1]
+
+
+# --> Test driven development helpers
+
+if "pytest" in sys.modules:
+    import pytest
+
+    EXAMPLE = """2-4,6-8
+2-3,4-5
+5-7,7-9
+2-8,3-7
+6-6,4-6
+2-6,4-8"""
+
+    def test_sample() -> None:
+        assert solve(EXAMPLE) == (2, 4)
+        assert solve(EXAMPLE + "\n") == (2, 4)
+
+    def test_parse_array() -> None:
+        assert parse_array("12-345,6-78\n").tolist() == [[12, 345, 6, 78]]
+        assert parse_array("").shape == (0, 4)
+        with pytest.raises(ValueError):
+            parse_array("1-2,3")
+
+    def test_matches_line_solvers() -> None:
+        from advent_2022.solvers import reference_answers
+
+        text, expected = reference_answers(__file__, 3_000, seed=4)
+        assert solve(text) == expected
+
+
+# --> Setup and run
+
+if __name__ == "__main__":
+    run_tests(__file__)
+    with open_input() as my_input:
+        contained, overlapping = run_solver(solve, my_input)
+        print("Part 1:", contained)
+        print("Part 2:", overlapping)
@@ -0,0 +1,74 @@
+"""Move crates with crane.move() vs the old per-move list copies
+
+    python bench_crane.py                        # 10^6 moves, stacks ~10^5 deep
+    python bench_crane.py --moves 1e5 --depth 1000
+
+The old part 1 popped crates one at a time; the old part 2 rebuilt the
+source stack on every move, which costs its whole depth. That one gets
+only --baseline moves, it's that slow.
+"""
+import argparse
+import random
+import time
+from pathlib import Path
+
+from advent_2022.generate import crane_moves
+from advent_2022.solvers import load_module
+
+part1 = load_module(Path(__file__).with_name("part1.py"))
+crane = load_module(Path(__file__).with_name("crane.py"))
+
+
+def popping(stacks, item):
+    source = stacks[item.source - 1]
+    dest = stacks[item.dest - 1]
+    for _i in range(item.move_qty):
+        dest.append(source.pop(-1))
+
+
+def copying(stacks, item):
+    source = stacks[item.source - 1]
+    removed, remaining = source[-item.move_qty :], source[: -item.move_qty]
+    stacks[item.source - 1] = remaining
+    stacks[item.dest - 1].extend(removed)
+
+
+def run(name, step, stacks, todo_list):
+    stacks = [list(s) for s in stacks]
+    start = time.perf_counter()
+    for item in todo_list:
+        step(stacks, item)
+    wall = time.perf_counter() - start
+    print(f"{name:<11} {len(todo_list):>9} moves {wall:8.2f}s  {crane.tops(stacks)}")
+    return crane.tops(stacks)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--moves", type=lambda s: int(float(s)), default=10**6)
+    parser.add_argument("--depth", type=lambda s: int(float(s)), default=2 * 10**5)
+    parser.add_argument("--baseline", type=lambda s: int(float(s)), default=10**4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    text = "".join(crane_moves(args.moves, rng, depth=args.depth))
+    stacks, todo_list = part1.parser(text)
+    todo_list = list(todo_list)
+    print(f"stacks {min(map(len, stacks))}-{max(map(len, stacks))} deep")
+
+    def engine(model):
+        return lambda stacks, item: crane.move(stacks, item, model)
+
+    assert run("pop", popping, stacks, todo_list) == run(
+        "move 9000", engine(crane.CRATEMOVER_9000), stacks, todo_list
+    )
+    few = todo_list[: args.baseline]
+    assert run("copy", copying, stacks, few) == run(
+        "move 9001", engine(crane.CRATEMOVER_9001), stacks, few
+    )
+    run("move 9001", engine(crane.CRATEMOVER_9001), stacks, todo_list)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Crate moves whose cost is the number of crates moved
+
+The CrateMover 9000 lifts one crate at a time, so the moved crates land in
+reverse order; the 9001 lifts them all at once and keeps their order.
+"""
+import sys
+
+# --> Puzzle solution
+
+CRATEMOVER_9000 = 9000
+CRATEMOVER_9001 = 9001
+
+
+def move(stacks, instruction, model):
+    """Carry out one instruction in place.
+
+    Taking and deleting the top move_qty crates only touches those crates,
+    however deep the stack under them is.
+    """
+    qty = instruction.move_qty
+    # a crate put back one at a time onto its own stack goes where it was
+    if qty <= 0 or instruction.source == instruction.dest:
+        return
+    source = stacks[instruction.source - 1]
+    moved = source[-qty:]
+    del source[-qty:]
+    if model == CRATEMOVER_9000:
+        moved.reverse()
+    stacks[instruction.dest - 1].extend(moved)
+
+
+def tops(stacks):
+    return "".join(s[-1] for s in stacks)
+
+
+# --> Test driven development helpers
+
+if "pytest" in sys.modules:
+    from collections import namedtuple
+
+    Instruction = namedtuple("Instruction", "move_qty,source,dest")
+
+    def test_move():
+        stacks = [list("ZN"), list("MCD"), list("P")]
+        move(stacks, Instruction(2, 2, 3), CRATEMOVER_9000)
+        assert stacks == [list("ZN"), list("M"), list("PDC")]
+        move(stacks, Instruction(3, 3, 1), CRATEMOVER_9001)
+        assert stacks == [list("ZNPDC"), list("M"), []]
+        move(stacks, Instruction(0, 2, 1), CRATEMOVER_9000)
+        assert tops(stacks[:2]) == "CM"
+
+    def test_move_onto_same_stack():
+        stacks = [list("ABC")]
+        for model in (CRATEMOVER_9000, CRATEMOVER_9001):
+            move(stacks, Instruction(2, 1, 1), model)
+            assert stacks == [list("ABC")]
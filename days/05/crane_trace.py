@@ -0,0 +1,107 @@
+import sys
+from pathlib import Path
+
+from advent_2022.harness import open_input, run_solver, run_tests
+from advent_2022.solvers import load_module
+from crane import CRATEMOVER_9000, CRATEMOVER_9001
+
+part1 = load_module(Path(__file__).with_name("part1.py"))
+
+# --> Puzzle solution
+
+# Only the crates that finish on top matter, so rather than moving every
+# crate forwards, follow each final top crate backwards through the moves
+# to where it started. All there is to track is each of those crates'
+# depth from the top of the stack it's on, however deep the stacks get.
+
+
+def trace_back(tracked, item, model):
+    """Undo item for the tracked crates: tracked[stack] holds a
+    [depth, final stack] pair for each one on that stack, and only the
+    source and dest lists change."""
+    source, dest, qty = item.source - 1, item.dest - 1, item.move_qty
+    if source == dest:
+        # crates moved onto their own stack end up where they were
+        return
+
+    stayed, moved = [], []
+    for crate in tracked[dest]:
+        if crate[0] >= qty:
+            crate[0] -= qty
+            stayed.append(crate)
+        else:
+            # the 9000 put the moved crates down in reverse
+            if model == CRATEMOVER_9000:
+                crate[0] = qty - 1 - crate[0]
+            moved.append(crate)
+    for crate in tracked[source]:
+        crate[0] += qty
+    tracked[dest] = stayed
+    tracked[source].extend(moved)
+
+
+def trace_tops(input_data, model):
+    stacks, todo_list = part1.parser(input_data)
+    todo_list = list(todo_list)
+    tracked = [[[0, stack]] for stack in range(len(stacks))]
+    for item in reversed(todo_list):
+        trace_back(tracked, item, model)
+
+    tops = [None] * len(stacks)
+    for stack, crates in enumerate(tracked):
+        for depth, final in crates:
+            tops[final] = stacks[stack][-1 - depth]
+    return "".join(tops)
+
+
+def solve1(input_data):
+    return trace_tops(input_data, CRATEMOVER_9000)
+
+
+def solve2(input_data):
+    return trace_tops(input_data, CRATEMOVER_9001)
+
+
+# --> Test driven development helpers
+
+if "pytest" in sys.modules:
+    import pytest
+
+    EXAMPLE = """    [D]
+[N] [C]
+[Z] [M] [P]
+ 1   2   3
+
+move 1 from 2 to 1
+move 3 from 1 to 3
+move 2 from 2 to 1
+move 1 from 1 to 2"""
+
+    @pytest.mark.parametrize(
+        "solve,sample_solution", [(solve1, "CMZ"), (solve2, "MCD")]
+    )
+    def test_samples(solve, sample_solution) -> None:
+        assert solve(EXAMPLE) == sample_solution
+
+    def test_same_stack() -> None:
+        text = "[A]\n[B]\n[C] [D]\n 1   2\n\nmove 2 from 1 to 1\n"
+        assert solve1(text) == "AD"
+        assert solve2(text) == "AD"
+        assert solve1(text) == part1.solve(text)
+
+    def test_matches_forward_simulation() -> None:
+        from advent_2022.solvers import reference_answers
+
+        text, expected = reference_answers(__file__, 5_000, seed=17)
+        assert (solve1(text), solve2(text)) == expected
+
+
+# --> Setup and run
+
+if __name__ == "__main__":
+    run_tests(__file__)
+    with open_input() as my_input:
+        result = run_solver(solve1, my_input)
+        print("Part 1:", result)
+        result = run_solver(solve2, my_input)
+        print("Part 2:", result)
@@ -1,10 +1,12 @@
 import re
 import sys
 from collections import namedtuple
-from pathlib import Path
+from itertools import takewhile
 
-import pytest
-from icecream import ic
+from advent_2022.debug import ic
+from advent_2022.harness import main
+from advent_2022.loader import lines
+from crane import CRATEMOVER_9000, move, tops
 
 # --> Puzzle solution
 
@@ -13,16 +15,16 @@ Instruction = namedtuple("Instruction", "move_qty,source,dest")
 
 
 def crates(line):
-    ic(line)
+    if __debug__ and ic.enabled:
+        ic(line)
     while line:
         yield (line[:4]).strip()
         line = line[4:]
 
 
 def parser(input_text):
-    config, instructions = input_text.split("\n\n")
-
-    config_lines = list(reversed(config.splitlines()))
+    input_lines = lines(input_text)
+    config_lines = list(reversed(list(takewhile(bool, input_lines))))
     nstacks = int(config_lines[0].split()[-1])
     stacks = [[] for _ in range(nstacks)]
 
@@ -33,11 +35,14 @@ def parser(input_text):
 
     ic(stacks)
 
-    todo_list = [
+    # the rest are the moves, parsed as they're carried out
+    todo_list = (
         Instruction(*(int(num) for num in re.findall(r"\d+", line)))
-        for line in instructions.splitlines()
-    ]
-    ic(todo_list)
+        for line in input_lines
+    )
+    if __debug__ and ic.enabled:
+        todo_list = list(todo_list)
+        ic(todo_list)
 
     return stacks, todo_list
 
@@ -45,18 +50,18 @@ def parser(input_text):
 def solve(input_data):
     stacks, todo_list = parser(input_data)
     for item in todo_list:
-        source = stacks[item.source - 1]
-        dest = stacks[item.dest - 1]
-        for _i in range(item.move_qty):
-            c = source.pop(-1)
-            dest.append(c)
-        ic(stacks)
-    return "".join((s[-1] for s in stacks))
+        move(stacks, item, CRATEMOVER_9000)
+        if __debug__ and ic.enabled:
+            ic(stacks)
+    return tops(stacks)
 
 
 # --> Test driven development helpers
 
-EXAMPLE = """    [D]
+if "pytest" in sys.modules:
+    import pytest
+
+    EXAMPLE = """    [D]
 [N] [C]
 [Z] [M] [P]
  1   2   3
@@ -66,35 +71,22 @@ move 3 from 1 to 3
 move 2 from 2 to 1
 move 1 from 1 to 2"""
 
-# keep pytest ids smaller
-def idfn(maybe_string):
-    if isinstance(maybe_string, str):
-        # chop off long input strings in test name output
-        return maybe_string[:5].strip()
-    return str(maybe_string)
+    # keep pytest ids smaller
+    def idfn(maybe_string):
+        if isinstance(maybe_string, str):
+            # chop off long input strings in test name output
+            return maybe_string[:5].strip()
+        return str(maybe_string)
 
-
-# Test any examples given in the problem
-@pytest.mark.parametrize("sample_data,sample_solution", [(EXAMPLE, "CMZ")], ids=idfn)
-def test_samples(sample_data, sample_solution) -> None:
-    assert solve(sample_data) == sample_solution
+    # Test any examples given in the problem
+    @pytest.mark.parametrize(
+        "sample_data,sample_solution", [(EXAMPLE, "CMZ")], ids=idfn
+    )
+    def test_samples(sample_data, sample_solution) -> None:
+        assert solve(sample_data) == sample_solution
 
 
 # --> Setup and run
 
 if __name__ == "__main__":
-
-    #  Run the test examples with icecream debug-trace turned on
-    ic.enable()
-    ex = pytest.main([__file__, "--capture=tee-sys", "-v"])
-    if ex != pytest.ExitCode.OK and ex != pytest.ExitCode.NO_TESTS_COLLECTED:
-        print(f"tests FAILED ({ex})")
-        sys.exit(1)
-    else:
-        print("tests PASSED")
-
-    #  Actual input data generally has more iterations, turn off log
-    ic.disable()
-    my_input = Path("input.txt").read_text()
-    result = solve(my_input)
-    print(result)
+    main(__file__, solve)
@@ -0,0 +1,138 @@
+import sys
+
+from advent_2022.harness import open_input, run_solver, run_tests
+from advent_2022.loader import as_bytes
+
+# --> Puzzle solution
+
+PACKET_LENGTH = 4
+MESSAGE_LENGTH = 14
+
+CHUNK_SIZE = 1 << 16
+
+
+def find_markers(chunks, lengths):
+    """{length: characters read once the last length of them are all
+    different} for each of lengths, from one pass over chunks of bytes.
+
+    last_seen[byte] is where byte last turned up, so a repeat moves the
+    start of the repeat-free window on in O(1) rather than rebuilding a set
+    or counter of the whole window at every position. The window grows at
+    most one character at a time, so it reaches the lengths in order, and
+    reading stops once it has reached the longest. Lengths with no marker
+    map to None.
+    """
+    wanted = sorted(set(lengths), reverse=True)
+    found = dict.fromkeys(lengths)
+    if not wanted:
+        return found
+    if wanted[-1] < 1:
+        raise ValueError("marker lengths start at 1")
+    last_seen = [-1] * 256
+    start = 0
+    offset = 0
+    for chunk in chunks:
+        for index, byte in enumerate(chunk, offset):
+            if last_seen[byte] >= start:
+                start = last_seen[byte] + 1
+            last_seen[byte] = index
+            if index - start + 1 == wanted[-1]:
+                found[wanted.pop()] = index + 1
+                if not wanted:
+                    return found
+        offset += len(chunk)
+    return found
+
+
+def read_chunks(stream, chunk_size=CHUNK_SIZE):
+    """Bytes from a binary file or pipe, a chunk at a time"""
+    return iter(lambda: stream.read(chunk_size), b"")
+
+
+def find_marker(input_data, length):
+    marker = find_markers([as_bytes(input_data)], [length])[length]
+    if marker is None:
+        raise ValueError(f"no marker of length {length}")
+    return marker
+
+
+def solve1(input_data):
+    return find_marker(input_data, PACKET_LENGTH)
+
+
+def solve2(input_data):
+    return find_marker(input_data, MESSAGE_LENGTH)
+
+
+# --> Test driven development helpers
+
+if "pytest" in sys.modules:
+    import pytest
+
+    SAMPLES = [
+        ("mjqjpqmgbljsphdztnvjfqwrcgsmlb", 7, 19),
+        ("bvwbjplbgvbhsrlpgdmjqwftvncz", 5, 23),
+        ("nppdvjthqldpwncqszvftbrmjlhg", 6, 23),
+        ("nznrnfrfntjfmvfwmzdfjlvtqnbhcprsg", 10, 29),
+        ("zcfzfwzzqfrljwzlrfnpqdbhtmscgvjw", 11, 26),
+    ]
+
+    @pytest.mark.parametrize("sample_data,packet,message", SAMPLES)
+    def test_samples(sample_data, packet, message) -> None:
+        assert solve1(sample_data) == packet
+        assert solve2(sample_data) == message
+        assert solve2(sample_data.encode()) == message
+
+    def test_any_length() -> None:
+        assert find_marker("aab", 1) == 1
+        assert find_marker(bytes(range(256)) * 2, 256) == 256
+        with pytest.raises(ValueError):
+            find_marker("abcabc", 4)
+
+    def test_one_pass_many_lengths() -> None:
+        import io
+
+        text = b"nznrnfrfntjfmvfwmzdfjlvtqnbhcprsg"
+        lengths = [14, 4, 1, 30]
+        expected = {1: 1, 4: 10, 14: 29, 30: None}
+        assert find_markers([text], lengths) == expected
+        for chunk_size in (1, 3, 64):
+            chunks = read_chunks(io.BytesIO(text), chunk_size)
+            assert find_markers(chunks, lengths) == expected
+
+        # stops reading at the marker
+        stream = io.BytesIO(text)
+        assert find_markers(read_chunks(stream, 4), [4]) == {4: 10}
+        assert stream.tell() == 12
+
+    def test_matches_set_windows() -> None:
+        import random
+
+        rng = random.Random(18)
+        for _ in range(200):
+            text = "".join(rng.choice("abcdef") for _ in range(60))
+            for length in range(1, 7):
+                expected = next(
+                    (
+                        i + length
+                        for i in range(len(text) - length + 1)
+                        if len(set(text[i : i + length])) == length
+                    ),
+                    None,
+                )
+                if expected is None:
+                    with pytest.raises(ValueError):
+                        find_marker(text, length)
+                else:
+                    assert find_marker(text, length) == expected
+
+
+# --> Setup and run
+
+if __name__ == "__main__":
+    run_tests(__file__)
+    with open_input() as my_input:
+        result = run_solver(solve1, my_input)
+        print("Part 1:", result)
+        result = run_solver(solve2, my_input)
+        print("Part 2:", result)
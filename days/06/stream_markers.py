@@ -0,0 +1,39 @@
+"""First marker of each length in a datastream too big to read in one go
+
+    python stream_markers.py input.txt              # packet and message
+    python -m advent_2022.generate 06 1e9 | python stream_markers.py -l 4 14 20
+
+One pass over the stream a chunk at a time, in constant memory, stopping as
+soon as the longest marker turns up.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+from advent_2022.solvers import load_module
+
+marker = load_module(Path(__file__).with_name("marker.py"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "input", nargs="?", type=argparse.FileType("rb"), default=sys.stdin.buffer
+    )
+    parser.add_argument(
+        "-l",
+        "--lengths",
+        type=int,
+        nargs="+",
+        default=[marker.PACKET_LENGTH, marker.MESSAGE_LENGTH],
+    )
+    parser.add_argument("--chunk-size", type=int, default=marker.CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    chunks = marker.read_chunks(args.input, args.chunk_size)
+    for length, position in marker.find_markers(chunks, args.lengths).items():
+        print(f"{length}: {'none' if position is None else position}")
+
+
+if __name__ == "__main__":
+    main()
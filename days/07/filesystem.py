@@ -0,0 +1,132 @@
+"""The elves' device filesystem, shared by both parts"""
+import sys
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from itertools import accumulate
+
+File = namedtuple("File", "size,name")
+
+
+class Directory:
+    # millions of these on a big terminal log; no per-instance __dict__
+    __slots__ = ["files", "children", "parent", "name", "size", "path", "index"]
+
+    def __init__(self, name, parent=None):
+        self.files = []
+        # subdirectories by name, so cd is a dict lookup
+        self.children = {}
+        self.parent = parent
+        self.name = name
+        # total of every file below here, kept up to date by add_file
+        self.size = 0
+        if parent is None:
+            self.path = name
+            # every directory in the tree by full path, shared by all of them
+            self.index = {}
+        else:
+            self.path = f"{parent.path.rstrip('/')}/{name}"
+            self.index = parent.index
+        self.index[self.path] = self
+
+    @property
+    def subdirectories(self):
+        return self.children.values()
+
+    def add_file(self, f):
+        self.files.append(f)
+        d = self
+        while d is not None:
+            d.size += f.size
+            d = d.parent
+
+    def add_subdirectory(self, name):
+        # listing a directory twice doesn't make a second copy
+        if name not in self.children:
+            self.children[name] = Directory(name, self)
+
+    def iter_subdirectories(self):
+        for d in self.children.values():
+            yield from d.iter_subdirectories()
+        yield self
+
+    def find_deep_subdirectory(self, name):
+        for d in self.iter_subdirectories():
+            if d.name == name:
+                return d
+        raise Exception("oooops, fell off the end")
+
+    def find_child_directory(self, name):
+        return self.children[name]
+
+    def find(self, path):
+        """The directory at an absolute path, like /a/e"""
+        return self.index[path]
+
+    def iter_under(self, path):
+        """Every directory at or below path, in O(k) for k of them"""
+        return self.find(path).iter_subdirectories()
+
+
+class SizeIndex:
+    """Directory sizes sorted once, with prefix sums, for O(log n) queries"""
+
+    __slots__ = ["sizes", "totals"]
+
+    def __init__(self, sizes):
+        self.sizes = sorted(sizes)
+        # totals[i] is the sum of the i smallest sizes
+        self.totals = list(accumulate(self.sizes, initial=0))
+
+    @classmethod
+    def of_tree(cls, root):
+        return cls(d.size for d in root.iter_subdirectories())
+
+    def smallest_at_least(self, size):
+        """The smallest directory size >= size, or None"""
+        i = bisect_left(self.sizes, size)
+        return self.sizes[i] if i < len(self.sizes) else None
+
+    def count_at_most(self, size):
+        return bisect_right(self.sizes, size)
+
+    def total_at_most(self, size):
+        """Sum of every directory size <= size"""
+        return self.totals[self.count_at_most(size)]
+
+
+# --> Test driven development helpers
+
+if "pytest" in sys.modules:
+
+    def test_sizes_add_up_the_tree():
+        root = Directory("/")
+        root.add_subdirectory("a")
+        a = root.find_child_directory("a")
+        a.add_subdirectory("e")
+        a.find_child_directory("e").add_file(File(584, "i"))
+        a.add_file(File(16, "f"))
+        root.add_file(File(400, "b.txt"))
+        assert [d.size for d in root.iter_subdirectories()] == [584, 600, 1000]
+        assert not hasattr(root, "__dict__")
+
+    def test_size_index():
+        index = SizeIndex([584, 94853, 24933642, 48381165])
+        assert index.total_at_most(100000) == 95437
+        assert index.total_at_most(583) == 0
+        assert index.count_at_most(94853) == 2
+        assert index.smallest_at_least(8381165) == 24933642
+        assert index.smallest_at_least(584) == 584
+        assert index.smallest_at_least(48381166) is None
+
+    def test_path_index():
+        root = Directory("/")
+        root.add_subdirectory("a")
+        root.add_subdirectory("d")
+        a = root.find_child_directory("a")
+        a.add_subdirectory("e")
+        a.add_subdirectory("e")
+        e = root.find("/a/e")
+        assert e.parent is a and e.path == "/a/e"
+        assert a.find("/d") is root.children["d"]
+        assert [d.path for d in root.iter_under("/a")] == ["/a/e", "/a"]
+        assert len(root.index) == 4
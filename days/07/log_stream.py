@@ -0,0 +1,189 @@
+"""Both day 7 answers streamed from the terminal log, no tree built
+
+    python log_stream.py input.txt
+    python -m advent_2022.generate 07 1e6 | python log_stream.py
+
+A stack holds the size so far of each directory the shell is inside, and
+a directory's size is final once `cd ..` leaves it (or the log ends), when
+it's added into its parent's. Like the puzzle's log, every directory is
+expected to be listed once.
+
+Part 2's threshold depends on root's size, which is only known once the
+log ends. A log that can be read twice (a string, a mapped or regular
+file) gets a first pass for root's size, and then memory is just the depth
+of the tree. A pipe is read once, and has to keep the directories that
+might still qualify: in the worst case that's all of them.
+"""
+import argparse
+import sys
+from heapq import heappop, heappush
+
+from advent_2022.loader import lines
+
+# --> Puzzle solution
+
+SMALL_DIRECTORY = 100000
+TOTAL_DISK_SPACE = 70000000
+FREE_SPACE_NEEDED = 30000000
+# the smallest directory part 2 can ask for: root's size less this
+KEEP = TOTAL_DISK_SPACE - FREE_SPACE_NEEDED
+
+
+def directory_sizes(log_lines):
+    """Each directory's total size, in the order the log finishes them"""
+    open_sizes = []
+    for line in log_lines:
+        if line.startswith("$ cd "):
+            dest = line[5:].strip()
+            if dest == "/":
+                while len(open_sizes) > 1:
+                    yield close(open_sizes)
+                if not open_sizes:
+                    open_sizes.append(0)
+            elif dest == "..":
+                if len(open_sizes) < 2:
+                    raise ValueError("cd .. out of the root directory")
+                yield close(open_sizes)
+            else:
+                open_sizes.append(0)
+        elif line.startswith("$") or line.startswith("dir "):
+            # $ ls, and subdirectories count once they're entered
+            continue
+        elif line.strip():
+            if not open_sizes:
+                raise ValueError("file listed before the first cd")
+            size, _name = line.split(maxsplit=1)
+            open_sizes[-1] += int(size)
+    while open_sizes:
+        yield close(open_sizes)
+
+
+def close(open_sizes):
+    size = open_sizes.pop()
+    if open_sizes:
+        open_sizes[-1] += size
+    return size
+
+
+def root_size(log_lines):
+    """Root's size: the last directory the log finishes"""
+    size = None
+    for size in directory_sizes(log_lines):
+        pass
+    if size is None:
+        raise ValueError("the log lists no directories")
+    return size
+
+
+def solve_stream(log_lines, root=None):
+    """(part 1, part 2) from one pass over the log's lines.
+
+    Part 2 wants the smallest directory of at least root's size less KEEP.
+    Given root, that's a running minimum. Without it, root is at least as
+    big as any directory, so a min-heap keeps the directories of at least
+    the largest so far less KEEP and drops the rest as the largest grows.
+    When root turns out smaller than KEEP plus the smallest directory,
+    nothing is ever dropped: memory linear in the number of directories,
+    O(n log n) time.
+    """
+    small_total = 0
+    largest = 0
+    to_delete = None
+    candidates = []
+    for size in directory_sizes(log_lines):
+        if size <= SMALL_DIRECTORY:
+            small_total += size
+        if root is not None:
+            if size >= root - KEEP and (to_delete is None or size < to_delete):
+                to_delete = size
+            continue
+        largest = max(largest, size)
+        while candidates and candidates[0] < largest - KEEP:
+            heappop(candidates)
+        if size >= largest - KEEP:
+            heappush(candidates, size)
+    if root is None and candidates:
+        # root is closed last and it's the largest, so the heap is pruned
+        # to the directories that qualify
+        to_delete = candidates[0]
+    if to_delete is None:
+        raise ValueError("the log lists no directories")
+    return small_total, to_delete
+
+
+def solve(input_data):
+    return solve_stream(lines(input_data), root_size(lines(input_data)))
+
+
+def solve1(input_data):
+    return solve(input_data)[0]
+
+
+def solve2(input_data):
+    return solve(input_data)[1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "input", nargs="?", type=argparse.FileType("r"), default=sys.stdin
+    )
+    args = parser.parse_args(argv)
+    root = None
+    if args.input.seekable():
+        root = root_size(args.input)
+        args.input.seek(0)
+    small_total, to_delete = solve_stream(args.input, root)
+    print("Part 1:", small_total)
+    print("Part 2:", to_delete)
+
+
+# --> Test driven development helpers
+
+if "pytest" in sys.modules:
+    from pathlib import Path
+
+    import pytest
+
+    from advent_2022.solvers import load_module
+
+    part1 = load_module(Path(__file__).with_name("part1.py"))
+
+    def test_sample():
+        assert solve(part1.EXAMPLE) == (95437, 24933642)
+        assert sorted(directory_sizes(part1.EXAMPLE.splitlines())) == [
+            584,
+            94853,
+            24933642,
+            48381165,
+        ]
+
+    def test_matches_tree_solvers(tmp_path):
+        from advent_2022.solvers import reference_answers
+
+        text, expected = reference_answers(__file__, 2_000, seed=22)
+        assert solve(text) == expected
+
+        path = tmp_path / "input.txt"
+        path.write_text(text)
+        with path.open() as f:
+            assert solve_stream(f) == expected
+
+    def test_every_directory_a_candidate():
+        # root below KEEP: every directory is big enough to free the space
+        log = "$ cd /\n$ ls\n10 a\n$ cd b\n$ ls\n5 c\n$ cd ..\n$ cd d\n$ ls\n7 e\n"
+        assert solve_stream(log.splitlines()) == (34, 5)
+        assert solve(log) == (34, 5)
+
+    def test_bad_logs():
+        for log in ("", "$ ls\n", "10 a\n", "$ cd /\n$ cd ..\n"):
+            with pytest.raises(ValueError):
+                solve(log)
+            with pytest.raises(ValueError):
+                solve_stream(log.splitlines())
+
+
+# --> Setup and run
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import sys
+
+import numpy as np
+
+from advent_2022.harness import open_input, run_solver, run_tests
+from advent_2022.loader import byte_array
+
+# --> Puzzle solution
+
+NEWLINE = ord("\n")
+ZERO = ord("0")
+
+
+def parser(input_data):
+    """The forest as an int8 array, straight from the bytes: every row is
+    the same length, so the file is a (rows, cols + 1) block of digits
+    and newlines"""
+    data = byte_array(input_data)
+    ends = np.flatnonzero(data == NEWLINE)
+    if not ends.size:
+        return np.zeros((0, 0), dtype=np.int8)
+    ncols = int(ends[0])
+    if ends.size * (ncols + 1) != data.size or np.any(ends % (ncols + 1) != ncols):
+        raise ValueError("forest rows are not all the same length")
+    grid = data.reshape(-1, ncols + 1)[:, :ncols]
+    return (grid - ZERO).astype(np.int8)
+
+
+def visible_from_top(grid):
+    """Trees taller than every tree above them; the top row is all visible"""
+    tallest = np.maximum.accumulate(grid, axis=0)
+    mask = np.ones(grid.shape, dtype=bool)
+    np.greater(grid[1:], tallest[:-1], out=mask[1:])
+    return mask
+
+
+def visibility(grid):
+    """Trees visible from any side: the same look from the top, over
+    flipped and transposed views of the forest"""
+    mask = visible_from_top(grid)
+    mask |= visible_from_top(grid[::-1])[::-1]
+    mask |= visible_from_top(grid.T).T
+    mask |= visible_from_top(grid.T[::-1])[::-1].T
+    return mask
+
+
+def distances_up(grid):
+    """How far each tree sees upwards: to the nearest tree above that's at
+    least as tall, or to the edge.
+
+    That nearest tree is what a monotonic stack down each column would
+    find. With heights 0-9 there's a quicker way in numpy: for each height,
+    the running maximum of the row numbers of trees at least that tall
+    gives every cell its nearest such tree, for all columns at once.
+    """
+    nrows = grid.shape[0]
+    index = np.min_scalar_type(nrows)
+    rows = np.arange(nrows, dtype=index)[:, None]
+    distances = np.zeros(grid.shape, dtype=index)
+    below, above = grid[1:], grid[:-1]
+    blockers = np.empty(above.shape, dtype=index)
+    for height in np.unique(below):
+        # row 0 for "no such tree" counts the trees up to the edge
+        np.multiply(above >= height, rows[:-1], out=blockers)
+        np.maximum.accumulate(blockers, axis=0, out=blockers)
+        np.subtract(rows[1:], blockers, out=blockers)
+        # each tree has one height, so adding in the masked distances
+        # fills every cell exactly once
+        blockers *= below == height
+        distances[1:] += blockers
+    return distances
+
+
+def iter_viewing_distances(grid):
+    """How far each tree sees left, right, up and down, one at a time"""
+    # the columns of a transposed copy are the rows, and contiguous
+    columns = np.ascontiguousarray(grid.T)
+    yield distances_up(columns).T
+    yield distances_up(columns[::-1])[::-1].T
+    del columns
+    yield distances_up(grid)
+    yield distances_up(grid[::-1])[::-1]
+
+
+def viewing_distances(grid):
+    """(left, right, up, down), the same arrays part2.py builds"""
+    return tuple(iter_viewing_distances(grid))
+
+
+def scenic_scores(grid):
+    scores = np.ones(grid.shape, dtype=np.int64)
+    for distances in iter_viewing_distances(grid):
+        scores *= distances
+    return scores
+
+
+def solve1(input_data):
+    return int(visibility(parser(input_data)).sum())
+
+
+def solve2(input_data):
+    grid = parser(input_data)
+    return int(scenic_scores(grid).max(initial=0))
+
+
+# --> Test driven development helpers
+
+if "pytest" in sys.modules:
+    import pytest
+
+    EXAMPLE = """30373
+25512
+65332
+33549
+35390
+"""
+
+    def test_sample() -> None:
+        assert solve1(EXAMPLE) == 21
+        assert solve1(EXAMPLE.rstrip()) == 21
+        assert solve2(EXAMPLE) == 8
+
+    def test_parser() -> None:
+        assert parser("012\n345").tolist() == [[0, 1, 2], [3, 4, 5]]
+        with pytest.raises(ValueError):
+            parser("012\n34\n")
+
+    def test_matches_row_walk() -> None:
+        from advent_2022.solvers import reference_answers
+
+        for side in (1, 2, 30):
+            text, expected = reference_answers(__file__, side, side, ("part1.py",))
+            assert (solve1(text),) == expected
+
+    def test_matches_look_out() -> None:
+        from pathlib import Path
+
+        from advent_2022.solvers import load_module, reference_answers
+
+        part2 = load_module(Path(__file__).with_name("part2.py"))
+        for side in (1, 2, 3, 40):
+            text, expected = reference_answers(__file__, side, side, ("part2.py",))
+            assert (solve2(text),) == expected
+            distances = part2.viewing_distances(part2.parser(text))
+            for mine, theirs in zip(viewing_distances(parser(text)), distances):
+                assert np.array_equal(mine, theirs)
+
+
+# --> Setup and run
+
+if __name__ == "__main__":
+    run_tests(__file__)
+    with open_input() as my_input:
+        result = run_solver(solve1, my_input)
+        print("Part 1:", result)
+        result = run_solver(solve2, my_input)
+        print("Part 2:", result)
@@ -1,10 +1,10 @@
 import sys
 from dataclasses import dataclass
-from pathlib import Path
 
 import numpy as np
-import pytest
-from icecream import ic
+
+from advent_2022.debug import ic
+from advent_2022.harness import main
 
 EXAMPLE = """R 4
 U 4
@@ -88,7 +88,8 @@ def solve(input_data):
     rope = Rope()
     for line in input_data.splitlines():
         point_dir, dist = line.split()
-        ic(line)
+        if __debug__ and ic.enabled:
+            ic(line)
         go_func = rope.__getattribute__(point_dir)
         go_func(int(dist))
 
@@ -97,37 +98,25 @@ def solve(input_data):
 
 # --> Test driven development helpers
 
-# keep pytest ids smaller
-def idfn(maybe_string):
-    if isinstance(maybe_string, str):
-        # chop off long input strings in test name output
-        return maybe_string[:5].strip()
-    return str(maybe_string)
+if "pytest" in sys.modules:
+    import pytest
 
+    # keep pytest ids smaller
+    def idfn(maybe_string):
+        if isinstance(maybe_string, str):
+            # chop off long input strings in test name output
+            return maybe_string[:5].strip()
+        return str(maybe_string)
 
-# Test any examples given in the problem
-@pytest.mark.parametrize(
-    "sample_data,sample_solution", [(EXAMPLE, 1), (LARGER_EXAMPLE, 36)], ids=idfn
-)
-def test_samples(sample_data, sample_solution) -> None:
-    assert solve(sample_data) == sample_solution
+    # Test any examples given in the problem
+    @pytest.mark.parametrize(
+        "sample_data,sample_solution", [(EXAMPLE, 1), (LARGER_EXAMPLE, 36)], ids=idfn
+    )
+    def test_samples(sample_data, sample_solution) -> None:
+        assert solve(sample_data) == sample_solution
 
 
 # --> Setup and run
 
 if __name__ == "__main__":
-
-    #  Run the test examples with icecream debug-trace turned on
-    ic.enable()
-    ex = pytest.main([__file__, "--capture=tee-sys", "-v"])
-    if ex != pytest.ExitCode.OK and ex != pytest.ExitCode.NO_TESTS_COLLECTED:
-        print(f"tests FAILED ({ex})")
-        sys.exit(1)
-    else:
-        print("tests PASSED")
-
-    #  Actual input data generally has more iterations, turn off log
-    ic.disable()
-    my_input = Path("input.txt").read_text()
-    result = solve(my_input)
-    print(result)
+    main(__file__, solve)
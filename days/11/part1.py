@@ -1,8 +1,8 @@
 import sys
-from pathlib import Path
 
-import pytest
-from icecream import ic
+from advent_2022.debug import ic
+from advent_2022.harness import main
+from advent_2022.loader import blocks
 
 
 # --> Puzzle solution
@@ -73,11 +73,11 @@ def play_round(monkeys):
 
 
 def solve(input_data):
-    blocks = input_data.split("\n\n")
-    n_monkeys = len(blocks)
+    monkey_blocks = list(blocks(input_data))
+    n_monkeys = len(monkey_blocks)
     monkeys = [Monkey(i) for i in range(n_monkeys)]
 
-    for monkey, data in zip(monkeys, blocks):
+    for monkey, data in zip(monkeys, monkey_blocks):
         monkey.setup(data, monkeys)
 
     for _ in range(20):
@@ -89,7 +89,10 @@ def solve(input_data):
 
 # --> Test driven development helpers
 
-EXAMPLE = """Monkey 0:
+if "pytest" in sys.modules:
+    import pytest
+
+    EXAMPLE = """Monkey 0:
   Starting items: 79, 98
   Operation: new = old * 19
   Test: divisible by 23
@@ -117,35 +120,22 @@ Monkey 3:
     If true: throw to monkey 0
     If false: throw to monkey 1"""
 
-# keep pytest ids smaller
-def idfn(maybe_string):
-    if isinstance(maybe_string, str):
-        # chop off long input strings in test name output
-        return maybe_string[:5].strip()
-    return str(maybe_string)
-
+    # keep pytest ids smaller
+    def idfn(maybe_string):
+        if isinstance(maybe_string, str):
+            # chop off long input strings in test name output
+            return maybe_string[:5].strip()
+        return str(maybe_string)
 
-# Test any examples given in the problem
-@pytest.mark.parametrize("sample_data,sample_solution", [(EXAMPLE, 10605)], ids=idfn)
-def test_samples(sample_data, sample_solution) -> None:
-    assert solve(sample_data) == sample_solution
+    # Test any examples given in the problem
+    @pytest.mark.parametrize(
+        "sample_data,sample_solution", [(EXAMPLE, 10605)], ids=idfn
+    )
+    def test_samples(sample_data, sample_solution) -> None:
+        assert solve(sample_data) == sample_solution
 
 
 # --> Setup and run
 
 if __name__ == "__main__":
-
-    #  Run the test examples with icecream debug-trace turned on
-    ic.enable()
-    ex = pytest.main([__file__, "--capture=tee-sys", "-v"])
-    if ex != pytest.ExitCode.OK and ex != pytest.ExitCode.NO_TESTS_COLLECTED:
-        print(f"tests FAILED ({ex})")
-        sys.exit(1)
-    else:
-        print("tests PASSED")
-
-    #  Actual input data generally has more iterations, turn off log
-    ic.disable()
-    my_input = Path("input.txt").read_text()
-    result = solve(my_input)
-    print(result)
+    main(__file__, solve)
@@ -1,8 +1,8 @@
 import sys
-from pathlib import Path
 
-import pytest
-from icecream import ic
+from advent_2022.debug import ic
+from advent_2022.harness import main
+from advent_2022.loader import blocks
 
 
 # --> Puzzle solution
@@ -63,13 +63,13 @@ class Monkey:
 
 
 def solve(input_data, nrounds):
-    blocks = input_data.split("\n\n")
-    n_monkeys = len(blocks)
+    monkey_blocks = list(blocks(input_data))
+    n_monkeys = len(monkey_blocks)
     all_monkeys = [Monkey(i) for i in range(n_monkeys)]
     items = {}
 
     product_of_primes = 1
-    for monkey, data in zip(all_monkeys, blocks):
+    for monkey, data in zip(all_monkeys, monkey_blocks):
         items[monkey] = monkey.setup(data, all_monkeys)
         product_of_primes *= monkey.test_val
 
@@ -84,7 +84,10 @@ def solve(input_data, nrounds):
 
 # --> Test driven development helpers
 
-EXAMPLE = """Monkey 0:
+if "pytest" in sys.modules:
+    import pytest
+
+    EXAMPLE = """Monkey 0:
   Starting items: 79, 98
   Operation: new = old * 19
   Test: divisible by 23
@@ -112,39 +115,24 @@ Monkey 3:
     If true: throw to monkey 0
     If false: throw to monkey 1"""
 
-# keep pytest ids smaller
-def idfn(maybe_string):
-    if isinstance(maybe_string, str):
-        # chop off long input strings in test name output
-        return maybe_string[:5].strip()
-    return str(maybe_string)
-
+    # keep pytest ids smaller
+    def idfn(maybe_string):
+        if isinstance(maybe_string, str):
+            # chop off long input strings in test name output
+            return maybe_string[:5].strip()
+        return str(maybe_string)
 
-# Test any examples given in the problem
-@pytest.mark.parametrize(
-    "sample_data,n_rounds,sample_solution",
-    [(EXAMPLE, 20, 103 * 99), (EXAMPLE, 1000, 5204 * 5192)],
-    ids=idfn,
-)
-def test_samples(sample_data, n_rounds, sample_solution) -> None:
-    assert solve(sample_data, n_rounds) == sample_solution
+    # Test any examples given in the problem
+    @pytest.mark.parametrize(
+        "sample_data,n_rounds,sample_solution",
+        [(EXAMPLE, 20, 103 * 99), (EXAMPLE, 1000, 5204 * 5192)],
+        ids=idfn,
+    )
+    def test_samples(sample_data, n_rounds, sample_solution) -> None:
+        assert solve(sample_data, n_rounds) == sample_solution
 
 
 # --> Setup and run
 
 if __name__ == "__main__":
-
-    #  Run the test examples with icecream debug-trace turned on
-    ic.enable()
-    ex = pytest.main([__file__, "--capture=tee-sys", "--pdb"])
-    if ex != pytest.ExitCode.OK and ex != pytest.ExitCode.NO_TESTS_COLLECTED:
-        print(f"tests FAILED ({ex})")
-        sys.exit(1)
-    else:
-        print("tests PASSED")
-
-    #  Actual input data generally has more iterations, turn off log
-    ic.disable()
-    my_input = Path("input.txt").read_text()
-    result = solve(my_input, 10_000)
-    print(result)
+    main(__file__, solve, 10_000, pytest_args=["--capture=tee-sys", "--pdb"])
@@ -1,11 +1,11 @@
 import sys
 from collections import UserDict, namedtuple
-from pathlib import Path
 from string import ascii_lowercase
 
 import numpy as np
-import pytest
-from icecream import ic
+
+from advent_2022.debug import ic
+from advent_2022.harness import open_input, run_solver, run_tests
 
 # a number longer than any path we'll be making
 NOT_REACHED = 1_000_000
@@ -45,17 +45,20 @@ class Puzzle:
         # assume start (current pos) is legal, but end could be trying
         # to walk off the edge
         if not 0 <= end[0] < self.grid.shape[0]:
-            ic("invalid index x")
+            if __debug__ and ic.enabled:
+                ic("invalid index x")
             return False
         if not 0 <= end[1] < self.grid.shape[1]:
-            ic("invalid index y")
+            if __debug__ and ic.enabled:
+                ic("invalid index y")
             return False
 
         # check elevation change rule
         start_elevation = self.grid[start]
         end_elevation = self.grid[end]
         if not (end_elevation <= start_elevation + 1):
-            ic("invalid elevation")
+            if __debug__ and ic.enabled:
+                ic("invalid elevation")
             return False
 
         # check already visited
@@ -115,48 +118,39 @@ def solve2(input_data):
 
 # --> Test driven development helpers
 
-EXAMPLE = """Sabqponm
+if "pytest" in sys.modules:
+    import pytest
+
+    EXAMPLE = """Sabqponm
 abcryxxl
 accszExk
 acctuvwj
 abdefghi"""
 
-# keep pytest ids smaller
-def idfn(maybe_string):
-    if isinstance(maybe_string, str):
-        # chop off long input strings in test name output
-        return maybe_string[:5].strip()
-    return str(maybe_string)
-
+    # keep pytest ids smaller
+    def idfn(maybe_string):
+        if isinstance(maybe_string, str):
+            # chop off long input strings in test name output
+            return maybe_string[:5].strip()
+        return str(maybe_string)
 
-# Test any examples given in the problem
-@pytest.mark.parametrize("sample_data,sample_solution", [(EXAMPLE, 31)], ids=idfn)
-def test_part1(sample_data, sample_solution) -> None:
-    assert solve1(sample_data) == sample_solution
+    # Test any examples given in the problem
+    @pytest.mark.parametrize("sample_data,sample_solution", [(EXAMPLE, 31)], ids=idfn)
+    def test_part1(sample_data, sample_solution) -> None:
+        assert solve1(sample_data) == sample_solution
 
-
-@pytest.mark.parametrize("sample_data,sample_solution", [(EXAMPLE, 29)], ids=idfn)
-def test_part2(sample_data, sample_solution) -> None:
-    assert solve2(sample_data) == sample_solution
+    @pytest.mark.parametrize("sample_data,sample_solution", [(EXAMPLE, 29)], ids=idfn)
+    def test_part2(sample_data, sample_solution) -> None:
+        assert solve2(sample_data) == sample_solution
 
 
 # --> Setup and run
 
 if __name__ == "__main__":
-
-    #  Run the test examples with icecream debug-trace turned on
-    ic.disable()
-    ex = pytest.main([__file__, "--capture=tee-sys", "-v"])
-    if ex != pytest.ExitCode.OK and ex != pytest.ExitCode.NO_TESTS_COLLECTED:
-        print(f"tests FAILED ({ex})")
-        sys.exit(1)
-    else:
-        print("tests PASSED")
-
-    #  Actual input data generally has more iterations, turn off log
-    ic.disable()
-    my_input = Path("input.txt").read_text()
-    result = solve1(my_input)
-    print("Part1:", result)
-    result = solve2(my_input)
-    print("Part2:", result)
+    # this day's trace is too long to read, even on the examples
+    run_tests(__file__, trace=False)
+    with open_input() as my_input:
+        result = run_solver(solve1, my_input)
+        print("Part1:", result)
+        result = run_solver(solve2, my_input)
+        print("Part2:", result)
@@ -1,9 +1,8 @@
 import sys
 from collections import namedtuple
-from pathlib import Path
 
-import pytest
-from icecream import ic
+from advent_2022.debug import ic
+from advent_2022.harness import main
 
 # --> Puzzle solution
 
@@ -96,14 +95,18 @@ class Accumulator:
             if (fill.x_min <= rng.x_min <= fill.x_max) or (
                 rng.x_min <= fill.x_min <= rng.x_max
             ):
-                ic("merging", fill, rng)
+                if __debug__ and ic.enabled:
+                    ic("merging", fill, rng)
                 fill.x_min = min(fill.x_min, rng.x_min)
                 fill.x_max = max(fill.x_max, rng.x_max)
-                ic(self.filled)
+                if __debug__ and ic.enabled:
+                    ic(self.filled)
                 return
-        ic("appending", rng)
+        if __debug__ and ic.enabled:
+            ic("appending", rng)
         self.filled.append(rng)
-        ic(self.filled)
+        if __debug__ and ic.enabled:
+            ic(self.filled)
 
     def count_spaces(self):
         count = 0
@@ -121,20 +124,23 @@ def solve(input_data, key_row):
 
     ranges = []
     for reading in sensor_data:
-        ic(reading)
+        if __debug__ and ic.enabled:
+            ic(reading)
         x_min = min(x_min, reading.sensor.x, reading.closest_beacon.x)
         x_max = max(x_max, reading.sensor.x, reading.closest_beacon.x)
 
         covered = reading.eval_row(key_row)
         if covered is not None:
-            ic(covered)
+            if __debug__ and ic.enabled:
+                ic(covered)
             ranges.append(covered)
 
     ic(x_min, x_max)
 
     acc = Accumulator(x_min, x_max)
     for r in sorted(ranges):
-        ic(r)
+        if __debug__ and ic.enabled:
+            ic(r)
         acc.add_range(r)
 
     return acc.count_spaces()
@@ -142,15 +148,17 @@ def solve(input_data, key_row):
 
 # --> Test driven development helpers
 
-# keep pytest ids smaller
-def idfn(maybe_string):
-    if isinstance(maybe_string, str):
-        # chop off long input strings in test name output
-        return maybe_string[:5].strip()
-    return str(maybe_string)
+if "pytest" in sys.modules:
+    import pytest
 
+    # keep pytest ids smaller
+    def idfn(maybe_string):
+        if isinstance(maybe_string, str):
+            # chop off long input strings in test name output
+            return maybe_string[:5].strip()
+        return str(maybe_string)
 
-EXAMPLE = """Sensor at x=2, y=18: closest beacon is at x=-2, y=15
+    EXAMPLE = """Sensor at x=2, y=18: closest beacon is at x=-2, y=15
 Sensor at x=9, y=16: closest beacon is at x=10, y=16
 Sensor at x=13, y=2: closest beacon is at x=15, y=3
 Sensor at x=12, y=14: closest beacon is at x=10, y=16
@@ -165,29 +173,15 @@ Sensor at x=16, y=7: closest beacon is at x=15, y=3
 Sensor at x=14, y=3: closest beacon is at x=15, y=3
 Sensor at x=20, y=1: closest beacon is at x=15, y=3"""
 
-# Test any examples given in the problem
-@pytest.mark.parametrize(
-    "sample_data,key_row,sample_solution", [(EXAMPLE, 10, 26)], ids=idfn
-)
-def test_samples(sample_data, key_row, sample_solution) -> None:
-    assert solve(sample_data, key_row) == sample_solution
+    # Test any examples given in the problem
+    @pytest.mark.parametrize(
+        "sample_data,key_row,sample_solution", [(EXAMPLE, 10, 26)], ids=idfn
+    )
+    def test_samples(sample_data, key_row, sample_solution) -> None:
+        assert solve(sample_data, key_row) == sample_solution
 
 
 # --> Setup and run
 
 if __name__ == "__main__":
-
-    #  Run the test examples with icecream debug-trace turned on
-    ic.enable()
-    ex = pytest.main([__file__, "--capture=tee-sys", "-v"])
-    if ex != pytest.ExitCode.OK and ex != pytest.ExitCode.NO_TESTS_COLLECTED:
-        print(f"tests FAILED ({ex})")
-        sys.exit(1)
-    else:
-        print("tests PASSED")
-
-    #  Actual input data generally has more iterations, turn off log
-    ic.disable()
-    my_input = Path("input.txt").read_text()
-    result = solve(my_input, 2000000)
-    print(result)
+    main(__file__, solve, 2000000)
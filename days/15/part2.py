@@ -1,9 +1,8 @@
 import sys
 from collections import namedtuple
-from pathlib import Path
 
-import pytest
-from icecream import ic
+from advent_2022.debug import ic
+from advent_2022.harness import main
 
 # --> Puzzle solution
 
@@ -101,15 +100,19 @@ class Accumulator:
             if (fill.x_min <= rng.x_min <= fill.x_max) or (
                 rng.x_min <= fill.x_min <= rng.x_max
             ):
-                ic("merging", fill, rng)
+                if __debug__ and ic.enabled:
+                    ic("merging", fill, rng)
                 fill.x_min = min(fill.x_min, rng.x_min)
                 fill.x_max = max(fill.x_max, rng.x_max)
-                ic(self.filled)
+                if __debug__ and ic.enabled:
+                    ic(self.filled)
                 return
 
-        ic("appending", rng)
+        if __debug__ and ic.enabled:
+            ic("appending", rng)
         self.filled.append(rng)
-        ic(self.filled)
+        if __debug__ and ic.enabled:
+            ic(self.filled)
 
 
 def solve(input_data, key_range):
@@ -121,7 +124,8 @@ def solve(input_data, key_range):
         for reading in sensor_data:
             covered = reading.eval_row(key_row)
             if covered is not None:
-                ic(covered)
+                if __debug__ and ic.enabled:
+                    ic(covered)
                 ranges.append(covered)
 
         acc = Accumulator(key_range[0], key_range[1])
@@ -137,15 +141,17 @@ def solve(input_data, key_range):
 
 # --> Test driven development helpers
 
-# keep pytest ids smaller
-def idfn(maybe_string):
-    if isinstance(maybe_string, str):
-        # chop off long input strings in test name output
-        return maybe_string[:5].strip()
-    return str(maybe_string)
+if "pytest" in sys.modules:
+    import pytest
 
+    # keep pytest ids smaller
+    def idfn(maybe_string):
+        if isinstance(maybe_string, str):
+            # chop off long input strings in test name output
+            return maybe_string[:5].strip()
+        return str(maybe_string)
 
-EXAMPLE = """Sensor at x=2, y=18: closest beacon is at x=-2, y=15
+    EXAMPLE = """Sensor at x=2, y=18: closest beacon is at x=-2, y=15
 Sensor at x=9, y=16: closest beacon is at x=10, y=16
 Sensor at x=13, y=2: closest beacon is at x=15, y=3
 Sensor at x=12, y=14: closest beacon is at x=10, y=16
@@ -160,29 +166,17 @@ Sensor at x=16, y=7: closest beacon is at x=15, y=3
 Sensor at x=14, y=3: closest beacon is at x=15, y=3
 Sensor at x=20, y=1: closest beacon is at x=15, y=3"""
 
-# Test any examples given in the problem
-@pytest.mark.parametrize(
-    "sample_data,key_range,sample_solution", [(EXAMPLE, (0, 20), 56000011)], ids=idfn
-)
-def test_samples(sample_data, key_range, sample_solution) -> None:
-    assert solve(sample_data, key_range) == sample_solution
+    # Test any examples given in the problem
+    @pytest.mark.parametrize(
+        "sample_data,key_range,sample_solution",
+        [(EXAMPLE, (0, 20), 56000011)],
+        ids=idfn,
+    )
+    def test_samples(sample_data, key_range, sample_solution) -> None:
+        assert solve(sample_data, key_range) == sample_solution
 
 
 # --> Setup and run
 
 if __name__ == "__main__":
-
-    #  Run the test examples with icecream debug-trace turned on
-    ic.enable()
-    ex = pytest.main([__file__, "--capture=tee-sys", "-v"])
-    if ex != pytest.ExitCode.OK and ex != pytest.ExitCode.NO_TESTS_COLLECTED:
-        print(f"tests FAILED ({ex})")
-        sys.exit(1)
-    else:
-        print("tests PASSED")
-
-    #  Actual input data generally has more iterations, turn off log
-    ic.disable()
-    my_input = Path("input.txt").read_text()
-    result = solve(my_input, (0, 4000000))
-    print(result)
+    main(__file__, solve, (0, 4000000))
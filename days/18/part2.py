@@ -1,12 +1,9 @@
 import sys
-from pathlib import Path
-
-import pytest
-from icecream import ic
-
 from collections import Counter
 from typing import NamedTuple
 
+from advent_2022.harness import main
+
 DIRECTIONS = ["north", "south", "east", "west", "up", "down"]
 OPPOSITE_DIRECTION = {
     "north": "south",
@@ -173,16 +170,18 @@ def solve(input_data):
 
 # --> Test driven development helpers
 
-# keep pytest ids smaller
-def idfn(maybe_string):
-    if isinstance(maybe_string, str):
-        # chop off long input strings in test name output
-        return maybe_string[:5].strip()
-    return str(maybe_string)
+if "pytest" in sys.modules:
+    import pytest
 
+    # keep pytest ids smaller
+    def idfn(maybe_string):
+        if isinstance(maybe_string, str):
+            # chop off long input strings in test name output
+            return maybe_string[:5].strip()
+        return str(maybe_string)
 
-EXAMPLE_1 = """1,1,1\n2,1,1"""
-EXAMPLE_2 = """2,2,2
+    EXAMPLE_1 = """1,1,1\n2,1,1"""
+    EXAMPLE_2 = """2,2,2
 1,2,2
 3,2,2
 2,1,2
@@ -196,30 +195,15 @@ EXAMPLE_2 = """2,2,2
 2,1,5
 2,3,5"""
 
-
-# Test any examples given in the problem
-@pytest.mark.parametrize(
-    "sample_data,sample_solution", [(EXAMPLE_1, 10), (EXAMPLE_2, 58)], ids=idfn
-)
-def test_samples(sample_data, sample_solution) -> None:
-    assert solve(sample_data) == sample_solution
+    # Test any examples given in the problem
+    @pytest.mark.parametrize(
+        "sample_data,sample_solution", [(EXAMPLE_1, 10), (EXAMPLE_2, 58)], ids=idfn
+    )
+    def test_samples(sample_data, sample_solution) -> None:
+        assert solve(sample_data) == sample_solution
 
 
 # --> Setup and run
 
 if __name__ == "__main__":
-
-    #  Run the test examples with icecream debug-trace turned on
-    ic.enable()
-    ex = pytest.main([__file__, "--capture=tee-sys", "--pdb"])
-    if ex != pytest.ExitCode.OK and ex != pytest.ExitCode.NO_TESTS_COLLECTED:
-        print(f"tests FAILED ({ex})")
-        sys.exit(1)
-    else:
-        print("tests PASSED")
-
-    #  Actual input data generally has more iterations, turn off log
-    ic.disable()
-    my_input = Path("input.txt").read_text()
-    result = solve(my_input)
-    print(result)
+    main(__file__, solve, pytest_args=["--capture=tee-sys", "--pdb"])
@@ -1,11 +1,9 @@
 import re
 import sys
 from collections import UserDict, deque
-from pathlib import Path
 from typing import Literal
 
-import pytest
-from icecream import ic
+from advent_2022.debug import ic
 
 DEADLINE = 999
 PART = 0
@@ -1,8 +1,7 @@
 import sys
-from pathlib import Path
 
-import pytest
-from icecream import ic
+from advent_2022.debug import ic
+from advent_2022.harness import main
 
 ENCRYPTION_KEY = 811589153
 
@@ -41,7 +40,8 @@ class Cycler:
             self.zero = self.items[-1]
 
         self.size = len(self.items)
-        self.debug()
+        if __debug__ and ic.enabled:
+            self.debug()
 
     def debug(self):
         start = ptr = self.items[0]
@@ -69,7 +69,8 @@ class Cycler:
 
                 next_.back = item
                 prev.fwd = item
-                self.debug()
+                if __debug__ and ic.enabled:
+                    self.debug()
 
             elif item.value > 0:
                 spaces = item.value
@@ -85,7 +86,8 @@ class Cycler:
 
                 next_.back = item
                 prev.fwd = item
-                self.debug()
+                if __debug__ and ic.enabled:
+                    self.debug()
 
     def score(self):
         result = []
@@ -113,16 +115,18 @@ def solve(input_data):
 
 # --> Test driven development helpers
 
-# keep pytest ids smaller
-def idfn(maybe_string):
-    if isinstance(maybe_string, str):
-        # chop off long input strings in test name output
-        return maybe_string[:5].strip()
-    return str(maybe_string)
+if "pytest" in sys.modules:
+    import pytest
 
+    # keep pytest ids smaller
+    def idfn(maybe_string):
+        if isinstance(maybe_string, str):
+            # chop off long input strings in test name output
+            return maybe_string[:5].strip()
+        return str(maybe_string)
 
-# Test any examples given in the problem
-EXAMPLE = """1
+    # Test any examples given in the problem
+    EXAMPLE = """1
 2
 -3
 3
@@ -130,29 +134,14 @@ EXAMPLE = """1
 0
 4"""
 
-
-@pytest.mark.parametrize(
-    "sample_data,sample_solution", [(EXAMPLE, 1623178306)], ids=idfn
-)
-def test_samples(sample_data, sample_solution) -> None:
-    assert sample_solution == solve(sample_data)
+    @pytest.mark.parametrize(
+        "sample_data,sample_solution", [(EXAMPLE, 1623178306)], ids=idfn
+    )
+    def test_samples(sample_data, sample_solution) -> None:
+        assert sample_solution == solve(sample_data)
 
 
 # --> Setup and run
 
 if __name__ == "__main__":
-
-    #  Run the test examples with icecream debug-trace turned on
-    ic.enable()
-    ex = pytest.main([__file__, "--capture=tee-sys", "-v"])
-    if ex != pytest.ExitCode.OK and ex != pytest.ExitCode.NO_TESTS_COLLECTED:
-        print(f"tests FAILED ({ex})")
-        sys.exit(1)
-    else:
-        print("tests PASSED")
-
-    #  Actual input data generally has more iterations, turn off log
-    ic.disable()
-    my_input = Path("input.txt").read_text()
-    result = solve(my_input)
-    print(result)
+    main(__file__, solve)
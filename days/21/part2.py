@@ -1,8 +1,6 @@
 from collections import defaultdict
-from pathlib import Path
 
-from sympy import Eq, Symbol, sympify
-from sympy import solve as sympy_solve
+from advent_2022.harness import main
 
 # --> Puzzle solution
 
@@ -86,6 +84,10 @@ def solve(input_data):
     left_side = Monkey.ALL_MONKEYS[monkey_1].decode()
     right_side = Monkey.ALL_MONKEYS[monkey_2].decode()
 
+    # sympy takes most of a second to import, only pay for it here
+    from sympy import Eq, Symbol, sympify
+    from sympy import solve as sympy_solve
+
     x = Symbol("x")
     result = Eq(sympify(left_side), sympify(right_side))
     answer = sympy_solve(result, x)
@@ -96,7 +98,4 @@ def solve(input_data):
 # --> Setup and run
 
 if __name__ == "__main__":
-
-    my_input = Path("input.txt").read_text()
-    answer = solve(my_input)
-    print(answer)
+    main(__file__, solve)
@@ -1,10 +1,10 @@
 import re
 import sys
-from pathlib import Path
 
 import numpy as np
-import pytest
-from icecream import ic
+
+from advent_2022.debug import ic
+from advent_2022.harness import main
 
 STEPS = {
     "north": (-1, 0),  # up one row, over 0
@@ -90,7 +90,8 @@ def solve(input_data):
     ic("starting", position, direction, STEPS[direction])
 
     for step in travel:
-        ic(step)
+        if __debug__ and ic.enabled:
+            ic(step)
         if step.isdigit():
             for _ in range(int(step)):
                 new_position = take_one_step(grid, position, direction)
@@ -98,11 +99,13 @@ def solve(input_data):
                     # location didn't update, must have hit a wall
                     break
                 position = new_position
-            ic("new position", new_position)
+            if __debug__ and ic.enabled:
+                ic("new position", new_position)
         else:
             # turn L or R
             direction = TURN_RESULTS[(direction, step)]
-            ic("new direction", direction)
+            if __debug__ and ic.enabled:
+                ic("new direction", direction)
 
     ic(position)
     return (position[0] + 1) * 1000 + (position[1] + 1) * 4 + SCORES[direction]
@@ -110,7 +113,10 @@ def solve(input_data):
 
 # --> Test driven development helpers
 
-EXAMPLE = """        ...#
+if "pytest" in sys.modules:
+    import pytest
+
+    EXAMPLE = """        ...#
         .#..
         #...
         ....
@@ -126,35 +132,20 @@ EXAMPLE = """        ...#
 10R5L5R10L4R5L5
 """
 
-# keep pytest ids smaller
-def idfn(maybe_string):
-    if isinstance(maybe_string, str):
-        # chop off long input strings in test name output
-        return maybe_string[:5].strip()
-    return str(maybe_string)
+    # keep pytest ids smaller
+    def idfn(maybe_string):
+        if isinstance(maybe_string, str):
+            # chop off long input strings in test name output
+            return maybe_string[:5].strip()
+        return str(maybe_string)
 
-
-# Test any examples given in the problem
-@pytest.mark.parametrize("sample_data,sample_solution", [(EXAMPLE, 6032)], ids=idfn)
-def test_samples(sample_data, sample_solution) -> None:
-    assert solve(sample_data) == sample_solution
+    # Test any examples given in the problem
+    @pytest.mark.parametrize("sample_data,sample_solution", [(EXAMPLE, 6032)], ids=idfn)
+    def test_samples(sample_data, sample_solution) -> None:
+        assert solve(sample_data) == sample_solution
 
 
 # --> Setup and run
 
 if __name__ == "__main__":
-
-    #  Run the test examples with icecream debug-trace turned on
-    ic.enable()
-    ex = pytest.main([__file__, "--capture=tee-sys", "-v"])
-    if ex != pytest.ExitCode.OK and ex != pytest.ExitCode.NO_TESTS_COLLECTED:
-        print(f"tests FAILED ({ex})")
-        sys.exit(1)
-    else:
-        print("tests PASSED")
-
-    #  Actual input data generally has more iterations, turn off log
-    ic.disable()
-    my_input = Path("input.txt").read_text()
-    result = solve(my_input)
-    print(result)
+    main(__file__, solve)
@@ -1,10 +1,9 @@
 import sys
 from collections import defaultdict
-from pathlib import Path
 from typing import NamedTuple
 
-import pytest
-from icecream import ic
+from advent_2022.debug import ic
+from advent_2022.harness import main
 
 
 class Position(NamedTuple):
@@ -53,7 +52,8 @@ def solve(input_data):
     rounds = 10
     stable = False
     while not stable:
-        ic(rounds)
+        if __debug__ and ic.enabled:
+            ic(rounds)
         stable = True
         # key = dest, value = elf/elves proposing to move there
         proposed_moves = defaultdict(list)
@@ -96,7 +96,8 @@ def solve(input_data):
         assert len(new_elf_positions) == len(elf_positions)
         elf_positions = new_elf_positions
         consider_order = consider_order[1:] + [consider_order[0]]
-        ic(consider_order)
+        if __debug__ and ic.enabled:
+            ic(consider_order)
 
         rounds -= 1
         if rounds == 0:
@@ -120,16 +121,18 @@ def solve(input_data):
 
 # --> Test driven development helpers
 
-# keep pytest ids smaller
-def idfn(maybe_string):
-    if isinstance(maybe_string, str):
-        # chop off long input strings in test name output
-        return maybe_string[:5].strip()
-    return str(maybe_string)
+if "pytest" in sys.modules:
+    import pytest
 
+    # keep pytest ids smaller
+    def idfn(maybe_string):
+        if isinstance(maybe_string, str):
+            # chop off long input strings in test name output
+            return maybe_string[:5].strip()
+        return str(maybe_string)
 
-# Test any examples given in the problem
-EXAMPLE = """....#..
+    # Test any examples given in the problem
+    EXAMPLE = """....#..
 ..###.#
 #...#.#
 .#...##
@@ -137,27 +140,12 @@ EXAMPLE = """....#..
 ##.#.##
 .#..#.."""
 
-
-@pytest.mark.parametrize("sample_data,sample_solution", [(EXAMPLE, 110)], ids=idfn)
-def test_samples(sample_data, sample_solution) -> None:
-    assert solve(sample_data) == sample_solution
+    @pytest.mark.parametrize("sample_data,sample_solution", [(EXAMPLE, 110)], ids=idfn)
+    def test_samples(sample_data, sample_solution) -> None:
+        assert solve(sample_data) == sample_solution
 
 
 # --> Setup and run
 
 if __name__ == "__main__":
-
-    #  Run the test examples with icecream debug-trace turned on
-    ic.enable()
-    ex = pytest.main([__file__, "--capture=tee-sys", "--pdb"])
-    if ex != pytest.ExitCode.OK and ex != pytest.ExitCode.NO_TESTS_COLLECTED:
-        print(f"tests FAILED ({ex})")
-        sys.exit(1)
-    else:
-        print("tests PASSED")
-
-    #  Actual input data generally has more iterations, turn off log
-    ic.disable()
-    my_input = Path("input.txt").read_text()
-    result = solve(my_input)
-    print(result)
+    main(__file__, solve, pytest_args=["--capture=tee-sys", "--pdb"])
@@ -1,11 +1,10 @@
 import sys
 from collections import deque
-from pathlib import Path
 from typing import Literal, NamedTuple
 
 import numpy as np
-import pytest
-from icecream import ic
+
+from advent_2022.harness import open_input, run_solver, run_tests
 
 # --> Puzzle solution
 # constants
@@ -180,50 +179,40 @@ def solve(input_data, which_part):
 
 # --> Test driven development helpers
 
-# keep pytest ids smaller
-def idfn(maybe_string):
-    if isinstance(maybe_string, str):
-        # chop off long input strings in test name output
-        return maybe_string[:5].strip()
-    return str(maybe_string)
+if "pytest" in sys.modules:
+    import pytest
 
+    # keep pytest ids smaller
+    def idfn(maybe_string):
+        if isinstance(maybe_string, str):
+            # chop off long input strings in test name output
+            return maybe_string[:5].strip()
+        return str(maybe_string)
 
-# Test any examples given in the problem
-EXAMPLE = """#.######
+    # Test any examples given in the problem
+    EXAMPLE = """#.######
 #>>.<^<#
 #.<..<<#
 #>v.><>#
 #<^v^^>#
 ######.#"""
 
-
-@pytest.mark.parametrize(
-    "sample_data,test_part,sample_solution",
-    [(EXAMPLE, 1, 18), (EXAMPLE, 2, 54)],
-    ids=idfn,
-)
-def test_samples(sample_data, test_part, sample_solution) -> None:
-    assert solve(sample_data, test_part) == sample_solution
+    @pytest.mark.parametrize(
+        "sample_data,test_part,sample_solution",
+        [(EXAMPLE, 1, 18), (EXAMPLE, 2, 54)],
+        ids=idfn,
+    )
+    def test_samples(sample_data, test_part, sample_solution) -> None:
+        assert solve(sample_data, test_part) == sample_solution
 
 
 # --> Setup and run
 
 if __name__ == "__main__":
+    run_tests(__file__)
+    with open_input() as my_input:
+        result = run_solver(solve, my_input, 1)
+        print("Part 1", result)
 
-    #  Run the test examples with icecream debug-trace turned on
-    ic.enable()
-    ex = pytest.main([__file__, "--capture=tee-sys", "-v"])
-    if ex != pytest.ExitCode.OK and ex != pytest.ExitCode.NO_TESTS_COLLECTED:
-        print(f"tests FAILED ({ex})")
-        sys.exit(1)
-    else:
-        print("tests PASSED")
-
-    #  Actual input data generally has more iterations, turn off log
-    ic.disable()
-    my_input = Path("input.txt").read_text()
-    result = solve(my_input, 1)
-    print("Part 1", result)
-
-    result = solve(my_input, 2)
-    print("Part 2", result)
+        result = run_solver(solve, my_input, 2)
+        print("Part 2", result)
@@ -1,9 +1,7 @@
 import sys
 from collections import defaultdict
-from pathlib import Path
 
-import pytest
-from icecream import ic
+from advent_2022.harness import main
 
 # --> Puzzle solution
 
@@ -118,42 +116,29 @@ def solve(input_data):
 
 # --> Test driven development helpers
 
-# keep pytest ids smaller
-def idfn(maybe_string):
-    if isinstance(maybe_string, str):
-        # chop off long input strings in test name output
-        return maybe_string[:5].strip()
-    return str(maybe_string)
+if "pytest" in sys.modules:
+    import pytest
 
+    # keep pytest ids smaller
+    def idfn(maybe_string):
+        if isinstance(maybe_string, str):
+            # chop off long input strings in test name output
+            return maybe_string[:5].strip()
+        return str(maybe_string)
 
-# Test any examples given in the problem
-@pytest.mark.parametrize("decimal,snafu", DECIMAL2SNAFU_EXAMPLES)
-def test_samples(decimal, snafu) -> None:
-    assert SNAFU(snafu).decimal == decimal
-    assert SNAFU.from_decimal(decimal).snafu == snafu
+    # Test any examples given in the problem
+    @pytest.mark.parametrize("decimal,snafu", DECIMAL2SNAFU_EXAMPLES)
+    def test_samples(decimal, snafu) -> None:
+        assert SNAFU(snafu).decimal == decimal
+        assert SNAFU.from_decimal(decimal).snafu == snafu
 
-
-@pytest.mark.parametrize("snafu,decimal", SNAFU2DECIMAL_EXAMPLES)
-def test_samples2(decimal, snafu) -> None:
-    assert SNAFU.from_decimal(decimal).snafu == snafu
-    assert SNAFU(snafu).decimal == decimal
+    @pytest.mark.parametrize("snafu,decimal", SNAFU2DECIMAL_EXAMPLES)
+    def test_samples2(decimal, snafu) -> None:
+        assert SNAFU.from_decimal(decimal).snafu == snafu
+        assert SNAFU(snafu).decimal == decimal
 
 
 # --> Setup and run
 
 if __name__ == "__main__":
-
-    #  Run the test examples with icecream debug-trace turned on
-    ic.enable()
-    ex = pytest.main([__file__, "--capture=tee-sys", "-v"])
-    if ex != pytest.ExitCode.OK and ex != pytest.ExitCode.NO_TESTS_COLLECTED:
-        print(f"tests FAILED ({ex})")
-        sys.exit(1)
-    else:
-        print("tests PASSED")
-
-    #  Actual input data generally has more iterations, turn off log
-    ic.disable()
-    my_input = Path("input.txt").read_text()
-    result = solve(my_input)
-    print(result)
+    main(__file__, solve)